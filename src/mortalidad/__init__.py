@@ -3,6 +3,13 @@
 from importlib import metadata
 from importlib.metadata import PackageNotFoundError
 
+import pandas as pd
+
+# Filtered slices of the shared base frame are never written in place, so
+# copy-on-write lets pandas skip the defensive copies it would otherwise make.
+# It is set on import so the app, the CLI and the tests run in the same mode.
+pd.set_option("mode.copy_on_write", True)
+
 
 def get_version() -> str:
     """Return the package version installed in the environment."""
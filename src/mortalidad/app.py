@@ -8,7 +8,7 @@ from dash import Dash
 
 from .callbacks import register_callbacks
 from .config import get_settings
-from .layout import build_layout
+from .layout import INDEX_STRING, build_layout, serve_static_layout
 from .logging import configure_logging, register_exception_handlers
 
 LOGGER = logging.getLogger(__name__)
@@ -23,9 +23,11 @@ def create_app() -> Dash:
         __name__,
         title="Mortalidad Colombia 2019",
         suppress_callback_exceptions=True,
+        index_string=INDEX_STRING,
     )
     register_exception_handlers(app)
     app.layout = build_layout(app)
+    serve_static_layout(app)
     register_callbacks(app)
     return app
 
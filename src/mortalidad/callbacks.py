@@ -2,20 +2,30 @@
 
 from __future__ import annotations
 
+import io
+import json
 import logging
-from collections.abc import Callable, Iterable
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
+from functools import cache, cached_property, lru_cache
 from typing import Any, Protocol, TypeVar, cast
 
+import numpy as np
+import numpy.typing as npt
 import pandas as pd
-from dash import Dash, Input, Output, State, dcc
+import plotly.io as pio
+from dash import MATCH, Dash, Input, Output, Patch, State, ctx, dcc
 from dash.exceptions import PreventUpdate
-from flask_caching import SimpleCache  # type: ignore[attr-defined]
+from flask_caching.backends import FileSystemCache
 
 from .components import bars, hist, lines
 from .components import map as map_component
 from .components import pie, stacked, table
 from .config import get_settings
-from .data_loader import GRUPO_EDAD_LABELS, load_data
+from .data_loader import GRUPO_EDAD_DTYPE, MONTH_LABELS, load_data
 
 LOGGER = logging.getLogger(__name__)
 
@@ -28,22 +38,115 @@ class CacheProtocol(Protocol):
     def set(self, key: str, value: object, timeout: int | None = None) -> bool: ...
 
 
+class _LRUCache:
+    """In-process LRU cache that keeps values by reference instead of pickling.
+
+    It mirrors the ``SimpleCache`` interface: ``timeout`` is in seconds and
+    ``0`` means the entry never expires.
+    """
+
+    def __init__(self, default_timeout: int = 300, threshold: int = 500) -> None:
+        self.default_timeout = default_timeout
+        self.threshold = threshold
+        self._entries: OrderedDict[str, tuple[float, object]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str, default: object | None = None) -> object:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at and expires_at < time.monotonic():
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: object, timeout: int | None = None) -> bool:
+        timeout = self.default_timeout if timeout is None else timeout
+        expires_at = time.monotonic() + timeout if timeout else 0.0
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.threshold:
+                self._entries.popitem(last=False)
+        return True
+
+
 CallbackFunc = TypeVar("CallbackFunc", bound=Callable[..., Any])
 
 SETTINGS = get_settings()
 CACHE_TIMEOUT = SETTINGS.cache_timeout
-SimpleCacheFactory = cast(Callable[..., CacheProtocol], SimpleCache)
-_CACHE: CacheProtocol = SimpleCacheFactory(default_timeout=CACHE_TIMEOUT)
-_BASE_DATA_KEY = "mortality_base_dataframe"
+FileSystemCacheFactory = cast(Callable[..., CacheProtocol], FileSystemCache)
+
 
+def _build_cache() -> CacheProtocol:
+    """Return a cache shared across workers when ``CACHE_DIR`` is configured.
 
+    Otherwise each worker keeps its own :class:`_LRUCache`.
+    """
+    if SETTINGS.cache_dir is not None:
+        return FileSystemCacheFactory(
+            str(SETTINGS.cache_dir), default_timeout=CACHE_TIMEOUT
+        )
+    return _LRUCache(default_timeout=CACHE_TIMEOUT)
+
+
+_CACHE: CacheProtocol = _build_cache()
+_AGG_CACHE: CacheProtocol = _build_cache()
+_FIG_CACHE: CacheProtocol = _build_cache()
+
+
+def _freeze_dataframe(df: pd.DataFrame) -> pd.DataFrame:
+    """Mark the NumPy blocks backing ``df`` as read-only and return it."""
+    for block in df._mgr.blocks:
+        values = block.values
+        if isinstance(values, np.ndarray):
+            values.setflags(write=False)
+    return df
+
+
+# Columns read by the figure and export builders; the rest are left out of the
+# shared frame so every filtered slice copies less data.
+DASHBOARD_COLUMNS = (
+    "depto_cod",
+    "depto",
+    "muni_cod",
+    "municipio",
+    "sexo",
+    "grupo_edad",
+    "grupo_edad_label",
+    "anio",
+    "mes",
+    "causa_cod",
+    "causa",
+    "homicidio_x95",
+    "lat",
+    "lon",
+)
+
+
+@lru_cache(maxsize=1)
 def _get_base_dataframe() -> pd.DataFrame:
-    cached = _CACHE.get(_BASE_DATA_KEY)
-    if cached is None:
-        LOGGER.info("Loading mortality dataset into cache")
-        cached = load_data(force_refresh=False)
-        _CACHE.set(_BASE_DATA_KEY, cached)
-    return cached.copy()
+    """Return the shared mortality frame loaded once per process.
+
+    The frame is returned by reference and its arrays are read-only, so the
+    export and figure builders must treat it as immutable and copy locally if
+    they ever need to write.
+    """
+    LOGGER.info("Loading mortality dataset into cache")
+    dataset = load_data(force_refresh=False)
+    columns = [column for column in DASHBOARD_COLUMNS if column in dataset.columns]
+    return _freeze_dataframe(dataset[columns])
+
+
+@lru_cache(maxsize=1)
+def _get_homicide_dataframe() -> pd.DataFrame:
+    """Return the X95 homicide rows of the base frame, extracted once."""
+    df = _get_base_dataframe()
+    positions = np.flatnonzero(df["homicidio_x95"].to_numpy() == 1)
+    return _freeze_dataframe(df.take(positions).reset_index(drop=True))
 
 
 def _filters_cache_key(
@@ -73,11 +176,156 @@ def _sanitize_select(value: str | None) -> str | None:
 def _sanitize_months(months: Iterable[int] | None) -> tuple[int, int]:
     if not months:
         return (1, 12)
-    values = sorted(int(m) for m in months)
-    start, end = values[0], values[-1]
-    if start > end:
-        start, end = end, start
-    return (max(1, start), min(12, end))
+    values = [int(m) for m in months]
+    return (max(1, min(values)), min(12, max(values)))
+
+
+@dataclass(frozen=True)
+class _FilterSelection:
+    """Sanitized UI filters shared by the figure and export callbacks."""
+
+    department: str | None
+    municipality: str | None
+    sex: str
+    homicide_only: bool
+    month_range: tuple[int, int]
+
+    @cached_property
+    def cache_key(self) -> str:
+        """Return the string key shared by every cache entry of this selection.
+
+        Cache backends such as ``FileSystemCache`` only accept string keys, so
+        the key is joined once per selection instead of on every lookup.
+        """
+        return _filters_cache_key(
+            self.department,
+            self.municipality,
+            self.sex,
+            self.homicide_only,
+            self.month_range,
+        )
+
+
+def _resolve_filters(
+    department_value: str | None,
+    municipality_value: str | None,
+    sex_value: str | None,
+    homicide_values: Iterable[str] | None,
+    month_values: Iterable[int] | None,
+) -> _FilterSelection:
+    return _FilterSelection(
+        department=_sanitize_select(department_value),
+        municipality=_sanitize_select(municipality_value),
+        sex=str(sex_value or "all").upper(),
+        homicide_only=any(
+            (item or "").lower() == "x95" for item in homicide_values or ()
+        ),
+        month_range=_sanitize_months(month_values),
+    )
+
+
+_NO_ROWS: npt.NDArray[np.int32] = np.empty(0, dtype=np.int32)
+_FULL_YEAR = (1, 12)
+
+
+def _source_dataframe(homicide_only: bool) -> pd.DataFrame:
+    """Return the shared frame a selection is filtered from."""
+    return _get_homicide_dataframe() if homicide_only else _get_base_dataframe()
+
+
+@cache
+def _row_index(homicide_only: bool, column: str) -> dict[Any, npt.NDArray[np.int32]]:
+    """Map each value of ``column`` to its sorted row positions in the source frame."""
+    frame = _source_dataframe(homicide_only)
+    groups = frame.groupby(column, observed=True, sort=False).indices
+    return {value: rows.astype(np.int32) for value, rows in groups.items()}
+
+
+def _equals_mask(
+    series: pd.Series, value: str, rows: npt.NDArray[np.int32] | None = None
+) -> npt.NDArray[np.bool_]:
+    """Compare ``series`` (restricted to ``rows``) to ``value``.
+
+    Categorical columns are compared on their integer codes.
+    """
+    dtype = series.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        if value not in dtype.categories:
+            size = len(series) if rows is None else len(rows)
+            return np.zeros(size, dtype=np.bool_)
+        code = dtype.categories.get_loc(value)
+        values: npt.NDArray[Any] = cast(pd.Categorical, series.array).codes
+    else:
+        code = value
+        values = series.to_numpy()
+    if rows is not None:
+        values = values[rows]
+    return cast(npt.NDArray[np.bool_], values == code)
+
+
+def _filter_positions(selection: _FilterSelection) -> npt.NDArray[np.int32]:
+    """Return the positions matching ``selection`` in its source frame.
+
+    The narrowest per-value row index among the active dimension filters
+    seeds the candidates; the month range and any other filters are then
+    checked on those rows only. The homicide toggle picks the source frame.
+    """
+    df = _source_dataframe(selection.homicide_only)
+    predicates = [
+        (column, value)
+        for column, value in (
+            ("muni_cod", selection.municipality),
+            ("depto_cod", selection.department),
+            ("sexo", selection.sex if selection.sex in {"M", "F"} else None),
+        )
+        if value
+    ]
+    indexed = sorted(
+        (
+            (_row_index(selection.homicide_only, column).get(value, _NO_ROWS), column)
+            for column, value in predicates
+        ),
+        key=lambda item: len(item[0]),
+    )
+    rows = indexed[0][0] if indexed else None
+
+    # The schema restricts ``mes`` to 1-12, so the full year needs no check.
+    mask: npt.NDArray[np.bool_] | None = None
+    if selection.month_range != _FULL_YEAR:
+        start, end = selection.month_range
+        months = df["mes"].to_numpy()
+        if rows is not None:
+            months = months[rows]
+        mask = (months >= start) & (months <= end)
+    values = dict(predicates)
+    for _, column in indexed[1:]:
+        matches = _equals_mask(df[column], values[column], rows)
+        mask = matches if mask is None else mask & matches
+
+    if mask is None:
+        return rows if rows is not None else np.arange(len(df), dtype=np.int32)
+    selected = np.flatnonzero(mask)
+    if rows is not None:
+        selected = rows[selected]
+    return selected.astype(np.int32)
+
+
+def _filter_dataframe(selection: _FilterSelection) -> pd.DataFrame:
+    """Return the rows matching ``selection``.
+
+    Only the row positions are cached, which keeps entries small enough to
+    share through the file-system backend.
+    """
+    df = _source_dataframe(selection.homicide_only)
+    cache_key = selection.cache_key
+    cached = _CACHE.get(cache_key)
+    if cached is None:
+        positions = _filter_positions(selection)
+        positions.setflags(write=False)
+        _CACHE.set(cache_key, positions)
+    else:
+        positions = cast(npt.NDArray[np.int32], cached)
+    return df.take(positions).reset_index(drop=True)
 
 
 def get_filters_state(
@@ -88,47 +336,104 @@ def get_filters_state(
     month_values: Iterable[int] | None,
 ) -> pd.DataFrame:
     """Return a filtered DataFrame based on UI selections."""
-    department = _sanitize_select(department_value)
-    municipality = _sanitize_select(municipality_value)
-    sex = str(sex_value or "all").upper()
-    homicide_only = bool(
-        homicide_values and "x95" in {item.lower() for item in homicide_values}
+    selection = _resolve_filters(
+        department_value,
+        municipality_value,
+        sex_value,
+        homicide_values,
+        month_values,
     )
-    month_range = _sanitize_months(month_values)
+    return _filter_dataframe(selection)
 
-    cache_key = _filters_cache_key(
-        department, municipality, sex, homicide_only, month_range
-    )
-    cached = _CACHE.get(cache_key)
-    if cached is not None:
-        return cached.copy()
 
-    df = _get_base_dataframe()
-    start, end = month_range
-    df = df[(df["mes"] >= start) & (df["mes"] <= end)]
+def _group_codes(series: pd.Series) -> tuple[npt.NDArray[np.intp], int]:
+    """Return sorted integer group codes for ``series`` (``-1`` when missing)."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series.cat.codes.to_numpy().astype(np.intp), len(series.cat.categories)
+    codes, uniques = pd.factorize(series, sort=True)
+    return codes.astype(np.intp), len(uniques)
+
 
-    if department:
-        df = df[df["depto_cod"] == department]
-    if municipality:
-        df = df[df["muni_cod"] == municipality]
-    if sex in {"M", "F"}:
-        df = df[df["sexo"] == sex]
-    if homicide_only:
-        df = df[df["homicidio_x95"] == 1]
+def _count_by(
+    df: pd.DataFrame,
+    keys: str | Sequence[str],
+    columns: Sequence[str] = (),
+    means: Sequence[str] = (),
+) -> pd.DataFrame:
+    """Count rows per ``keys`` with ``np.bincount`` instead of a groupby.
+
+    Rows come out in the order ``groupby(keys, observed=True)`` would sort
+    them. ``columns`` must be determined by the keys; they are taken from the
+    first row of each group. ``means`` are averaged ignoring missing values.
+    """
+    keys = [keys] if isinstance(keys, str) else list(keys)
+    codes, size = _group_codes(df[keys[0]])
+    for key in keys[1:]:
+        key_codes, key_size = _group_codes(df[key])
+        codes = np.where(
+            (codes < 0) | (key_codes < 0), -1, codes * key_size + key_codes
+        )
+        size *= key_size
+    valid = codes >= 0
+    group_codes = codes[valid]
+    counts = np.bincount(group_codes, minlength=size)
+    present = np.flatnonzero(counts)
+
+    rows = np.flatnonzero(valid)
+    first_rows = np.empty(size, dtype=np.intp)
+    first_rows[group_codes[::-1]] = rows[::-1]
+    result = df.iloc[first_rows[present]][[*keys, *columns]].reset_index(drop=True)
+    result["total"] = counts[present]
+    for column in means:
+        values = df[column].to_numpy(dtype=float)[valid]
+        observed = ~np.isnan(values)
+        sums = np.bincount(
+            group_codes[observed], weights=values[observed], minlength=size
+        )
+        totals = np.bincount(group_codes[observed], minlength=size)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            result[column] = (sums / totals)[present]
+    return result
+
+
+def _precompute_aggregates(df: pd.DataFrame) -> dict[str, pd.DataFrame]:
+    """Count the filtered rows once for each chart dimension.
+
+    Each frame matches the ``groupby(...).agg(total=...)`` table the matching
+    builder would otherwise compute from the raw rows.
+    """
+    homicides = df[df["homicidio_x95"].to_numpy() == 1]
+    return {
+        "lines": _count_by(df, ["anio", "mes"]),
+        "bars": _count_by(homicides, "muni_cod", ["municipio", "depto"]),
+        "pie": _count_by(df, "muni_cod", ["municipio"]),
+        "stacked": _count_by(df, ["depto", "sexo"]),
+        "hist": _count_by(df, "grupo_edad_label"),
+    }
+
+
+def _select_extremes(
+    frame: pd.DataFrame, k: int, key: str, largest: bool
+) -> pd.DataFrame:
+    """Return the ``k`` rows with the largest (or smallest) ``total``.
 
-    filtered = df.reset_index(drop=True)
-    _CACHE.set(cache_key, filtered)
-    return filtered.copy()
+    ``np.partition`` finds the k-th total in linear time so only the rows that
+    can make the cut are sorted; ties are broken by ``key``.
+    """
+    totals = frame["total"].to_numpy()
+    if len(totals) > k:
+        ranked = -totals if largest else totals
+        threshold = np.partition(ranked, k - 1)[k - 1]
+        frame = frame[ranked <= threshold]
+    return frame.sort_values(["total", key], ascending=[not largest, True]).head(k)
 
 
 def _map_export(df: pd.DataFrame) -> pd.DataFrame:
     required = {"depto_cod", "depto", "lat", "lon", "causa_cod"}
     if not required.issubset(df.columns):
         return pd.DataFrame(columns=["depto_cod", "depto", "total", "lat", "lon"])
-    return (
-        df.groupby(["depto_cod", "depto"], as_index=False)
-        .agg(total=("causa_cod", "size"), lat=("lat", "mean"), lon=("lon", "mean"))
-        .sort_values("total", ascending=False)
+    return _count_by(df, "depto_cod", ["depto"], means=["lat", "lon"]).sort_values(
+        ["total", "depto_cod"], ascending=[False, True]
     )
 
 
@@ -136,12 +441,8 @@ def _monthly_export(df: pd.DataFrame) -> pd.DataFrame:
     required = {"anio", "mes", "causa_cod"}
     if not required.issubset(df.columns):
         return pd.DataFrame(columns=["anio", "mes", "mes_label", "total"])
-    exported = (
-        df.groupby(["anio", "mes"], as_index=False)
-        .agg(total=("causa_cod", "size"))
-        .sort_values(["anio", "mes"])
-    )
-    exported["mes_label"] = exported["mes"].map(lambda month: f"{month:02d}")
+    exported = _count_by(df, ["anio", "mes"])
+    exported["mes_label"] = MONTH_LABELS[exported["mes"].to_numpy()]
     return exported[["anio", "mes", "mes_label", "total"]]
 
 
@@ -150,24 +451,16 @@ def _homicide_export(df: pd.DataFrame) -> pd.DataFrame:
     if not required.issubset(df.columns):
         return pd.DataFrame(columns=["muni_cod", "municipio", "depto", "total"])
     filtered = df[df["homicidio_x95"] == 1]
-    return (
-        filtered.groupby(["muni_cod", "municipio", "depto"], as_index=False)
-        .agg(total=("causa_cod", "size"))
-        .sort_values("total", ascending=False)
-        .head(5)
-    )
+    counted = _count_by(filtered, "muni_cod", ["municipio", "depto"])
+    return _select_extremes(counted, 5, "muni_cod", largest=True)
 
 
 def _low_mortality_export(df: pd.DataFrame) -> pd.DataFrame:
     required = {"muni_cod", "municipio", "causa_cod"}
     if not required.issubset(df.columns):
         return pd.DataFrame(columns=["muni_cod", "municipio", "total"])
-    return (
-        df.groupby(["muni_cod", "municipio"], as_index=False)
-        .agg(total=("causa_cod", "size"))
-        .sort_values("total", ascending=True)
-        .head(10)
-    )
+    counted = _count_by(df, "muni_cod", ["municipio"])
+    return _select_extremes(counted, 10, "muni_cod", largest=False)
 
 
 def _stacked_export(df: pd.DataFrame) -> pd.DataFrame:
@@ -175,13 +468,12 @@ def _stacked_export(df: pd.DataFrame) -> pd.DataFrame:
     if not required.issubset(df.columns):
         return pd.DataFrame(columns=["depto", "sexo", "total"])
     mapping = {"F": "Mujeres", "M": "Hombres"}
-    exported = (
-        df.groupby(["depto", "sexo"], as_index=False)
-        .agg(total=("causa_cod", "size"))
-        .assign(sexo=lambda frame: frame["sexo"].map(mapping).fillna(frame["sexo"]))
-    )
-    exported["sexo"] = pd.Categorical(
-        exported["sexo"], categories=["Mujeres", "Hombres"], ordered=True
+    exported = _count_by(df, ["depto", "sexo"])
+    exported["sexo"] = (
+        exported["sexo"]
+        .astype("category")
+        .cat.rename_categories(lambda code: mapping.get(code, code))
+        .cat.set_categories(["Mujeres", "Hombres"], ordered=True)
     )
     return exported.sort_values(["depto", "sexo"]).reset_index(drop=True)
 
@@ -190,25 +482,175 @@ def _hist_export(df: pd.DataFrame) -> pd.DataFrame:
     required = {"grupo_edad", "grupo_edad_label", "causa_cod"}
     if not required.issubset(df.columns):
         return pd.DataFrame(columns=["grupo_edad_label", "total"])
-    order = list(GRUPO_EDAD_LABELS.values())
-    aggregated = (
-        df.groupby(["grupo_edad", "grupo_edad_label"], as_index=False)
-        .agg(total=("causa_cod", "size"))
-        .sort_values("grupo_edad")
+    aggregated = _count_by(df, "grupo_edad", ["grupo_edad_label"]).sort_values(
+        "grupo_edad"
     )
-    aggregated["grupo_edad_label"] = pd.Categorical(
-        aggregated["grupo_edad_label"], categories=order, ordered=True
+    aggregated["grupo_edad_label"] = aggregated["grupo_edad_label"].astype(
+        GRUPO_EDAD_DTYPE
     )
     aggregated = aggregated.sort_values(["grupo_edad_label"]).drop(columns="grupo_edad")
     return aggregated.reset_index(drop=True)
 
 
-def _table_export(df: pd.DataFrame) -> pd.DataFrame:
-    records = table.top_causes_records(df)
-    export_df = pd.DataFrame.from_records(records)
-    if not export_df.empty:
-        export_df = export_df[["causa_cod", "causa", "total"]]
-    return export_df
+_EXPORT_BUILDERS: dict[str, Callable[[pd.DataFrame], pd.DataFrame]] = {
+    "map": _map_export,
+    "lines": _monthly_export,
+    "bars": _homicide_export,
+    "pie": _low_mortality_export,
+    "stacked": _stacked_export,
+    "hist": _hist_export,
+}
+
+
+_EXPORT_FILENAMES: dict[str, str] = {
+    "map": "mapa_departamentos.csv",
+    "lines": "serie_mensual.csv",
+    "bars": "top_homicidios.csv",
+    "pie": "ciudades_menor_mortalidad.csv",
+    "stacked": "sexo_departamento.csv",
+    "hist": "distribucion_grupo_edad.csv",
+}
+
+# Collects the five filter values into ``filter-batch`` once they have been quiet
+# for a short while, so a burst of changes (a department pick resetting the
+# municipality, quick toggles) refreshes the figures once. Superseded calls
+# resolve to ``no_update``; the first call, on page load, is not delayed.
+_FILTER_BATCH_JS = """
+function (department, municipality, sex, homicide, months) {
+    const token = (window._mortalidadFilterBatch || 0) + 1;
+    window._mortalidadFilterBatch = token;
+    const payload = {department, municipality, sex, homicide, months};
+    if (token === 1) {
+        return payload;
+    }
+    return new Promise((resolve) => setTimeout(() => resolve(
+        token === window._mortalidadFilterBatch
+            ? payload
+            : window.dash_clientside.no_update
+    ), 150));
+}
+"""
+
+# The table export is exactly the records already held by the DataTable, so the
+# browser writes the CSV itself instead of asking the server to rebuild it. The
+# figure exports carry columns (codes, coordinates) the traces do not, so they
+# stay server-side.
+_TABLE_EXPORT_JS = """
+function (nClicks, rows) {
+    if (!nClicks || !rows || !rows.length) {
+        return window.dash_clientside.no_update;
+    }
+    const columns = ["causa_cod", "causa", "total"];
+    const quote = (value) => typeof value === "number"
+        ? String(value)
+        : '"' + String(value ?? "").replace(/"/g, '""') + '"';
+    const lines = [columns.map(quote).join(",")];
+    for (const row of rows) {
+        lines.push(columns.map((column) => quote(row[column])).join(","));
+    }
+    return {
+        content: lines.join("\\n") + "\\n",
+        filename: "top_causas.csv",
+        base64: false,
+        type: "text/csv",
+    };
+}
+"""
+
+
+def _cached_export(selection: _FilterSelection, name: str) -> pd.DataFrame:
+    """Return the export aggregation ``name`` memoized per filter state."""
+    cache_key = f"{selection.cache_key}::{name}"
+    cached = _AGG_CACHE.get(cache_key)
+    if cached is not None:
+        return cast(pd.DataFrame, cached)
+    exported = _EXPORT_BUILDERS[name](_filter_dataframe(selection))
+    _AGG_CACHE.set(cache_key, exported)
+    return exported
+
+
+def _cached_top_causes(selection: _FilterSelection) -> list[dict[str, object]]:
+    """Return the top-causes table records memoized per filter state.
+
+    The records feed the on-screen table, which the clientside export reuses.
+    """
+    cache_key = f"{selection.cache_key}::records"
+    cached = _AGG_CACHE.get(cache_key)
+    if cached is not None:
+        return cast(list[dict[str, object]], cached)
+    records = table.top_causes_records(_filter_dataframe(selection))
+    _AGG_CACHE.set(cache_key, records)
+    return records
+
+
+def _build_figures(df: pd.DataFrame) -> tuple[Any, ...]:
+    """Build the six dashboard figures from the filtered rows."""
+    counts = _precompute_aggregates(df)
+    return (
+        map_component.build_choropleth_figure(df),
+        lines.build_monthly_line_figure(df, counts=counts["lines"]),
+        bars.build_top_homicide_bars(df, counts=counts["bars"]),
+        pie.build_lowest_mortality_pie(df, counts=counts["pie"]),
+        stacked.build_stacked_bar_figure(df, counts=counts["stacked"]),
+        hist.build_age_histogram(df, counts=counts["hist"]),
+    )
+
+
+def _cached_figures(selection: _FilterSelection) -> tuple[dict[str, Any], ...] | None:
+    """Return the dashboard figures memoized per filter state.
+
+    Figures are cached as serialized JSON, so a repeated filter state skips
+    both the Plotly build and its validation. ``None`` means no rows matched.
+    """
+    cache_key = f"{selection.cache_key}::figures"
+    cached = _FIG_CACHE.get(cache_key)
+    if cached is None:
+        filtered = _filter_dataframe(selection)
+        if filtered.empty:
+            return None
+        cached = tuple(
+            pio.to_json(figure, validate=False) for figure in _build_figures(filtered)
+        )
+        _FIG_CACHE.set(cache_key, cached)
+    return tuple(json.loads(payload) for payload in cast(tuple[str, ...], cached))
+
+
+# Top-level layout keys the figure builders emit besides the template. Patches
+# delete the ones a new figure lacks so nothing stale survives a transition
+# between a chart and its empty placeholder.
+_FIGURE_LAYOUT_KEYS = frozenset(
+    {
+        "annotations",
+        "barmode",
+        "barnorm",
+        "height",
+        "legend",
+        "mapbox",
+        "margin",
+        "title",
+        "uirevision",
+        "xaxis",
+        "yaxis",
+    }
+)
+
+
+def _figure_patch(figure: dict[str, Any]) -> Patch:
+    """Return a patch that turns the rendered figure into ``figure``.
+
+    Every figure shares the same resolved template, which accounts for most of
+    its serialized size; the graphs already hold it from the initial layout, so
+    only the traces and the remaining layout keys are sent.
+    """
+    layout = {
+        key: value for key, value in figure["layout"].items() if key != "template"
+    }
+    patch = Patch()
+    patch["data"] = figure["data"]
+    for key in _FIGURE_LAYOUT_KEYS.difference(layout):
+        del patch["layout"][key]
+    patch["layout"].update(layout)
+    return patch
 
 
 def _build_department_options(df: pd.DataFrame) -> list[dict[str, str]]:
@@ -225,19 +667,84 @@ def _build_department_options(df: pd.DataFrame) -> list[dict[str, str]]:
     return [{"label": "Todos", "value": "all"}] + options_list
 
 
-def _build_municipality_options(df: pd.DataFrame) -> list[dict[str, str]]:
-    options = (
-        df[["muni_cod", "municipio"]]
+def _build_municipality_options(
+    df: pd.DataFrame,
+) -> dict[str | None, tuple[dict[str, str], ...]]:
+    """Group municipality options by department code in one sorted pass.
+
+    The ``None`` entry holds every municipality.
+    """
+    municipalities = (
+        df[["depto_cod", "muni_cod", "municipio"]]
         .drop_duplicates()
-        .sort_values("municipio")
-        .assign(
-            label=lambda frame: frame["municipio"],
-            value=lambda frame: frame["muni_cod"],
-        )[["label", "value"]]
-        .to_dict("records")
+        .sort_values("municipio", kind="stable")
+    )
+    all_option = {"label": "Todos", "value": "all"}
+    grouped: dict[str | None, list[dict[str, str]]] = {None: [all_option]}
+    for department, value, label in municipalities.itertuples(index=False):
+        option = {"label": label, "value": value}
+        grouped[None].append(option)
+        grouped.setdefault(department, [all_option]).append(option)
+    return {department: tuple(options) for department, options in grouped.items()}
+
+
+@lru_cache(maxsize=1)
+def _department_options() -> tuple[dict[str, str], ...]:
+    """Return the department options, computed once per process."""
+    return tuple(_build_department_options(_get_base_dataframe()))
+
+
+@lru_cache(maxsize=1)
+def _municipality_options_by_department() -> (
+    dict[str | None, tuple[dict[str, str], ...]]
+):
+    """Return every municipality option list, computed once per process."""
+    return _build_municipality_options(_get_base_dataframe())
+
+
+def _municipality_options(department: str | None) -> tuple[dict[str, str], ...]:
+    """Return the municipality options for ``department`` (``None`` for all)."""
+    options = _municipality_options_by_department()
+    return options.get(department or None, options[None][:1])
+
+
+@lru_cache(maxsize=1)
+def _empty_outputs() -> tuple[Any, Any, Any, Any, Any, Any, Any, str]:
+    """Return the placeholder outputs shown when no rows match the filters."""
+    empty = pd.DataFrame()
+    return (
+        map_component.build_choropleth_figure(empty),
+        lines.build_monthly_line_figure(empty),
+        bars.build_top_homicide_bars(empty),
+        pie.build_lowest_mortality_pie(empty),
+        stacked.build_stacked_bar_figure(empty),
+        hist.build_age_histogram(empty),
+        [],
+        "Sin datos para filtros seleccionados.",
     )
-    options_list = cast(list[dict[str, str]], options)
-    return [{"label": "Todos", "value": "all"}] + options_list
+
+
+def _clear_caches() -> None:
+    """Drop every memoized result derived from the base dataframe."""
+    _get_homicide_dataframe.cache_clear()
+    _row_index.cache_clear()
+    _department_options.cache_clear()
+    _municipality_options_by_department.cache_clear()
+
+
+def _send_arrow_csv(df: pd.DataFrame, filename: str) -> dict[str, Any]:
+    """Serialize ``df`` with pyarrow's CSV writer, falling back to pandas."""
+    try:
+        import pyarrow as pa  # type: ignore
+        import pyarrow.csv as pa_csv  # type: ignore
+    except ImportError:
+        return cast(
+            dict[str, Any], dcc.send_data_frame(df.to_csv, filename, index=False)
+        )
+
+    buffer = io.BytesIO()
+    pa_csv.write_csv(pa.Table.from_pandas(df, preserve_index=False), buffer)
+    return cast(dict[str, Any], dcc.send_bytes(buffer.getvalue(), filename))
 
 
 def register_callbacks(app: Dash) -> None:
@@ -250,13 +757,13 @@ def register_callbacks(app: Dash) -> None:
         decorator = app.callback(*args, **kwargs)
         return cast(Callable[[CallbackFunc], CallbackFunc], decorator)
 
+    # Any static prop works as a one-shot trigger that fires on page load.
     @callback(
         Output("filter-department", "options"),
-        Input("app-title", "children"),
+        Input("filter-department", "id"),
     )
     def populate_department_options(_: str) -> list[dict[str, str]]:
-        dataframe = _get_base_dataframe()
-        return _build_department_options(dataframe)
+        return list(_department_options())
 
     @callback(
         Output("filter-municipality", "options"),
@@ -267,16 +774,23 @@ def register_callbacks(app: Dash) -> None:
     def update_municipality_options(
         department_value: str | None, current_value: str | None
     ) -> tuple[list[dict[str, str]], str]:
-        dataframe = _get_base_dataframe()
         department = _sanitize_select(department_value)
-        if department:
-            dataframe = dataframe[dataframe["depto_cod"] == department]
-        options = _build_municipality_options(dataframe)
+        options = list(_municipality_options(department))
         option_values = {option["value"] for option in options}
         if department and _sanitize_select(current_value) not in option_values:
             return options, "all"
         return options, current_value or "all"
 
+    app.clientside_callback(
+        _FILTER_BATCH_JS,
+        Output("filter-batch", "data"),
+        Input("filter-department", "value"),
+        Input("filter-municipality", "value"),
+        Input("filter-sex", "value"),
+        Input("filter-homicide", "value"),
+        Input("filter-months", "value"),
+    )
+
     @callback(
         Output("mortality-map", "figure"),
         Output("mortality-lines", "figure"),
@@ -286,34 +800,26 @@ def register_callbacks(app: Dash) -> None:
         Output("mortality-hist", "figure"),
         Output("mortality-table", "data"),
         Output("mortality-table-message", "children"),
-        Input("filter-department", "value"),
-        Input("filter-municipality", "value"),
-        Input("filter-sex", "value"),
-        Input("filter-homicide", "value"),
-        Input("filter-months", "value"),
+        Input("filter-batch", "data"),
     )
     def update_visualizations(
-        department_value: str | None,
-        municipality_value: str | None,
-        sex_value: str | None,
-        homicide_values: Iterable[str] | None,
-        month_values: Iterable[int] | None,
+        batch: dict[str, Any] | None,
     ) -> tuple[Any, Any, Any, Any, Any, Any, Any, str]:
-        filtered = get_filters_state(
-            department_value,
-            municipality_value,
-            sex_value,
-            homicide_values,
-            month_values,
+        filters = batch or {}
+        selection = _resolve_filters(
+            filters.get("department"),
+            filters.get("municipality"),
+            filters.get("sex"),
+            filters.get("homicide"),
+            filters.get("months"),
+        )
+        figures = _cached_figures(selection)
+        if figures is None:
+            return _empty_outputs()
+        map_fig, line_fig, bars_fig, pie_fig, stacked_fig, hist_fig = map(
+            _figure_patch, figures
         )
-        map_fig = map_component.build_choropleth_figure(filtered)
-        line_fig = lines.build_monthly_line_figure(filtered)
-        bars_fig = bars.build_top_homicide_bars(filtered)
-        pie_fig = pie.build_lowest_mortality_pie(filtered)
-        stacked_fig = stacked.build_stacked_bar_figure(filtered)
-        hist_fig = hist.build_age_histogram(filtered)
-        table_data = table.top_causes_records(filtered)
-        message = "Sin datos para filtros seleccionados." if filtered.empty else ""
+        table_data = _cached_top_causes(selection)
         return (
             map_fig,
             line_fig,
@@ -322,20 +828,9 @@ def register_callbacks(app: Dash) -> None:
             stacked_fig,
             hist_fig,
             table_data,
-            message,
+            "",
         )
 
-    def _export_payload(
-        filtered: pd.DataFrame,
-        builder: Callable[[pd.DataFrame], pd.DataFrame],
-    ) -> pd.DataFrame:
-        if filtered.empty:
-            raise PreventUpdate
-        export_df = builder(filtered)
-        if export_df.empty:
-            raise PreventUpdate
-        return export_df
-
     common_states = (
         State("filter-department", "value"),
         State("filter-municipality", "value"),
@@ -345,120 +840,12 @@ def register_callbacks(app: Dash) -> None:
     )
 
     @callback(
-        Output("download-map", "data"),
-        Input("export-map", "n_clicks"),
-        *common_states,
-        prevent_initial_call=True,
-    )
-    def export_map(
-        n_clicks: int,
-        department: str | None,
-        municipality: str | None,
-        sex: str | None,
-        homicide: Iterable[str] | None,
-        months: Iterable[int] | None,
-    ) -> dict[str, Any]:
-        if not n_clicks:
-            raise PreventUpdate
-        filtered = get_filters_state(department, municipality, sex, homicide, months)
-        export_df = _export_payload(filtered, _map_export)
-        return cast(
-            dict[str, Any],
-            dcc.send_data_frame(
-                export_df.to_csv,
-                "mapa_departamentos.csv",
-                index=False,
-            ),
-        )
-
-    @callback(
-        Output("download-lines", "data"),
-        Input("export-lines", "n_clicks"),
-        *common_states,
-        prevent_initial_call=True,
-    )
-    def export_lines(
-        n_clicks: int,
-        department: str | None,
-        municipality: str | None,
-        sex: str | None,
-        homicide: Iterable[str] | None,
-        months: Iterable[int] | None,
-    ) -> dict[str, Any]:
-        if not n_clicks:
-            raise PreventUpdate
-        filtered = get_filters_state(department, municipality, sex, homicide, months)
-        export_df = _export_payload(filtered, _monthly_export)
-        return cast(
-            dict[str, Any],
-            dcc.send_data_frame(
-                export_df.to_csv,
-                "serie_mensual.csv",
-                index=False,
-            ),
-        )
-
-    @callback(
-        Output("download-bars", "data"),
-        Input("export-bars", "n_clicks"),
-        *common_states,
-        prevent_initial_call=True,
-    )
-    def export_bars(
-        n_clicks: int,
-        department: str | None,
-        municipality: str | None,
-        sex: str | None,
-        homicide: Iterable[str] | None,
-        months: Iterable[int] | None,
-    ) -> dict[str, Any]:
-        if not n_clicks:
-            raise PreventUpdate
-        filtered = get_filters_state(department, municipality, sex, homicide, months)
-        export_df = _export_payload(filtered, _homicide_export)
-        return cast(
-            dict[str, Any],
-            dcc.send_data_frame(
-                export_df.to_csv,
-                "top_homicidios.csv",
-                index=False,
-            ),
-        )
-
-    @callback(
-        Output("download-pie", "data"),
-        Input("export-pie", "n_clicks"),
-        *common_states,
-        prevent_initial_call=True,
-    )
-    def export_pie(
-        n_clicks: int,
-        department: str | None,
-        municipality: str | None,
-        sex: str | None,
-        homicide: Iterable[str] | None,
-        months: Iterable[int] | None,
-    ) -> dict[str, Any]:
-        if not n_clicks:
-            raise PreventUpdate
-        filtered = get_filters_state(department, municipality, sex, homicide, months)
-        export_df = _export_payload(filtered, _low_mortality_export)
-        return cast(
-            dict[str, Any],
-            dcc.send_data_frame(
-                export_df.to_csv,
-                "ciudades_menor_mortalidad.csv",
-                index=False,
-            ),
-        )
-
-    @callback(
-        Output("download-stacked", "data"),
-        Input("export-stacked", "n_clicks"),
+        Output({"role": "download", "card": MATCH}, "data"),
+        Input({"role": "export", "card": MATCH}, "n_clicks"),
         *common_states,
         prevent_initial_call=True,
     )
-    def export_stacked(
+    def export_figure_data(
         n_clicks: int,
         department: str | None,
         municipality: str | None,
@@ -468,70 +855,20 @@ def register_callbacks(app: Dash) -> None:
     ) -> dict[str, Any]:
         if not n_clicks:
             raise PreventUpdate
-        filtered = get_filters_state(department, municipality, sex, homicide, months)
-        export_df = _export_payload(filtered, _stacked_export)
-        return cast(
-            dict[str, Any],
-            dcc.send_data_frame(
-                export_df.to_csv,
-                "sexo_departamento.csv",
-                index=False,
-            ),
-        )
-
-    @callback(
-        Output("download-hist", "data"),
-        Input("export-hist", "n_clicks"),
-        *common_states,
-        prevent_initial_call=True,
-    )
-    def export_hist(
-        n_clicks: int,
-        department: str | None,
-        municipality: str | None,
-        sex: str | None,
-        homicide: Iterable[str] | None,
-        months: Iterable[int] | None,
-    ) -> dict[str, Any]:
-        if not n_clicks:
+        name = ctx.triggered_id["card"]
+        selection = _resolve_filters(department, municipality, sex, homicide, months)
+        export_df = _cached_export(selection, name)
+        if export_df.empty:
             raise PreventUpdate
-        filtered = get_filters_state(department, municipality, sex, homicide, months)
-        export_df = _export_payload(filtered, _hist_export)
-        return cast(
-            dict[str, Any],
-            dcc.send_data_frame(
-                export_df.to_csv,
-                "distribucion_grupo_edad.csv",
-                index=False,
-            ),
-        )
+        return _send_arrow_csv(export_df, _EXPORT_FILENAMES[name])
 
-    @callback(
+    app.clientside_callback(
+        _TABLE_EXPORT_JS,
         Output("download-table", "data"),
         Input("export-table", "n_clicks"),
-        *common_states,
+        State("mortality-table", "data"),
         prevent_initial_call=True,
     )
-    def export_table(
-        n_clicks: int,
-        department: str | None,
-        municipality: str | None,
-        sex: str | None,
-        homicide: Iterable[str] | None,
-        months: Iterable[int] | None,
-    ) -> dict[str, Any]:
-        if not n_clicks:
-            raise PreventUpdate
-        filtered = get_filters_state(department, municipality, sex, homicide, months)
-        export_df = _export_payload(filtered, _table_export)
-        return cast(
-            dict[str, Any],
-            dcc.send_data_frame(
-                export_df.to_csv,
-                "top_causas.csv",
-                index=False,
-            ),
-        )
 
 
 __all__ = ["get_filters_state", "register_callbacks"]
@@ -3,18 +3,28 @@
 from __future__ import annotations
 
 import logging
+from typing import TYPE_CHECKING
 
 import click
 import pandas as pd
 
-from .app import app
 from .config import get_settings
 from .data_loader import MORTALITY_SCHEMA, get_parquet_engine, load_data
 from .logging import configure_logging
 
+if TYPE_CHECKING:
+    from dash import Dash
+
 LOGGER = logging.getLogger(__name__)
 
 
+def _get_app() -> Dash:
+    """Import the Dash app on demand so only ``serve`` pays for building it."""
+    from .app import app
+
+    return app
+
+
 @click.group()
 def cli() -> None:
     """Mortality dashboard utilities."""
@@ -56,7 +66,7 @@ def serve(host: str, port: int | None, debug: bool | None) -> None:
     run_port = port or settings.port
     run_debug = debug if debug is not None else settings.is_development
     click.echo(f"Sirviendo en http://{host}:{run_port} (debug={run_debug})")
-    app.run(host=host, port=run_port, debug=run_debug)
+    _get_app().run(host=host, port=run_port, debug=run_debug)
 
 
 if __name__ == "__main__":
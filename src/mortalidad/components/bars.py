@@ -3,85 +3,61 @@
 from __future__ import annotations
 
 import pandas as pd
-import plotly.graph_objects as go
 from dash import dcc, html
 from plotly.graph_objects import Figure
 
+from mortalidad.components.figures import build_figure, empty_figure
+
 
 def build_top_homicide_bars(
     data: pd.DataFrame,
     *,
+    counts: pd.DataFrame | None = None,
     top_n: int = 5,
     title: str = "Top 5 ciudades con más homicidios (X95)",
 ) -> Figure:
-    """Return a bar chart with the top cities ranked by homicide X95 counts."""
+    """Return a bar chart with the top cities ranked by homicide X95 counts.
+
+    ``counts`` may hold the per-municipality homicide totals already computed.
+    """
     required = {"homicidio_x95", "muni_cod", "municipio", "depto", "causa_cod"}
     if data.empty or not required.issubset(data.columns):
-        figure = go.Figure()
-        figure.update_layout(
-            template="plotly_white",
-            title=title,
-            annotations=[
-                dict(
-                    text="Sin datos para filtros seleccionados",
-                    x=0.5,
-                    y=0.5,
-                    xref="paper",
-                    yref="paper",
-                    showarrow=False,
-                    font=dict(color="#5f6b7a"),
-                )
-            ],
-        )
-        return figure
+        return empty_figure(title)
 
-    filtered = data[data["homicidio_x95"] == 1]
-    if filtered.empty:
-        figure = Figure()
-        figure.update_layout(
-            template="plotly_white",
-            title=title,
-            annotations=[
-                dict(
-                    text="Sin datos para filtros seleccionados",
-                    x=0.5,
-                    y=0.5,
-                    xref="paper",
-                    yref="paper",
-                    showarrow=False,
-                    font=dict(color="#5f6b7a"),
-                )
-            ],
+    if counts is None:
+        counts = (
+            data[data["homicidio_x95"] == 1]
+            .groupby(["muni_cod", "municipio", "depto"], observed=True)
+            .size()
+            .reset_index(name="total")
         )
-        return figure
+    if counts.empty:
+        return empty_figure(title)
 
-    ranked = (
-        filtered.groupby(["muni_cod", "municipio", "depto"], as_index=False)
-        .agg(total=("causa_cod", "size"))
-        .sort_values(["total", "municipio"], ascending=[False, True])
-        .head(top_n)
+    ranked = counts.sort_values(["total", "muni_cod"], ascending=[False, True]).head(
+        top_n
     )
 
-    figure = go.Figure(
-        go.Bar(
-            x=ranked["municipio"],
-            y=ranked["total"],
-            text=ranked["total"].map(lambda value: f"{value:,}"),
-            marker_color="#c0392b",
-            hovertemplate="%{x}<br>%{y:,} homicidios<extra></extra>",
-        )
-    )
-    figure.update_traces(textposition="outside")
-    figure.update_layout(
-        template="plotly_white",
-        title=title,
-        xaxis_title="Municipio",
-        yaxis_title="Homicidios (X95)",
-        margin=dict(l=10, r=10, t=60, b=40),
-        height=380,
+    return build_figure(
+        [
+            {
+                "type": "bar",
+                "x": ranked["municipio"].to_numpy(),
+                "y": ranked["total"].to_numpy(),
+                "text": ranked["total"].map("{:,}".format).to_numpy(),
+                "textposition": "outside",
+                "marker": {"color": "#c0392b"},
+                "hovertemplate": "%{x}<br>%{y:,} homicidios<extra></extra>",
+            }
+        ],
+        {
+            "title": {"text": title},
+            "xaxis": {"title": {"text": "Municipio"}},
+            "yaxis": {"title": {"text": "Homicidios (X95)"}, "tickformat": ","},
+            "margin": {"l": 10, "r": 10, "t": 60, "b": 40},
+            "height": 380,
+        },
     )
-    figure.update_yaxes(tickformat=",")
-    return figure
 
 
 def render(data: pd.DataFrame | None = None, title: str | None = None) -> html.Div:
@@ -3,10 +3,10 @@
 from __future__ import annotations
 
 import pandas as pd
-import plotly.express as px
 from dash import dcc, html
 from plotly.graph_objects import Figure
 
+from mortalidad.components.figures import build_figure, empty_figure
 from mortalidad.data_loader import GRUPO_EDAD_LABELS
 
 AGE_ORDER = list(GRUPO_EDAD_LABELS.values())
@@ -15,57 +15,51 @@ AGE_ORDER = list(GRUPO_EDAD_LABELS.values())
 def build_age_histogram(
     data: pd.DataFrame,
     *,
+    counts: pd.DataFrame | None = None,
     title: str = "Distribución por grupo de edad",
 ) -> Figure:
-    """Return a histogram-like bar chart ordered by age groups."""
+    """Return a histogram-like bar chart ordered by age groups.
+
+    ``counts`` may hold the per-age-group totals already computed.
+    """
     required = {"grupo_edad", "grupo_edad_label", "causa_cod"}
     if data.empty or not required.issubset(data.columns):
-        figure = Figure()
-        figure.update_layout(
-            template="plotly_white",
-            title=title,
-            annotations=[
-                dict(
-                    text="Sin datos para filtros seleccionados",
-                    x=0.5,
-                    y=0.5,
-                    xref="paper",
-                    yref="paper",
-                    showarrow=False,
-                    font=dict(color="#5f6b7a"),
-                )
-            ],
-        )
-        return figure
+        return empty_figure(title)
 
+    if counts is None:
+        counts = (
+            data.groupby("grupo_edad_label", observed=True, sort=False)
+            .size()
+            .reset_index(name="total")
+        )
     counts = (
-        data.groupby("grupo_edad_label", as_index=False)
-        .agg(total=("causa_cod", "size"))
-        .set_index("grupo_edad_label")
+        counts.set_index("grupo_edad_label")
         .reindex(AGE_ORDER, fill_value=0)
         .reset_index()
     )
 
-    figure = px.bar(
-        counts,
-        x="grupo_edad_label",
-        y="total",
-        category_orders={"grupo_edad_label": AGE_ORDER},
-        title=title,
-    )
-    figure.update_traces(
-        hovertemplate="%{x}<br>%{y:,} defunciones<extra></extra>",
-        marker_color="#2471a3",
-    )
-    figure.update_layout(
-        template="plotly_white",
-        xaxis_title="Grupo de edad",
-        yaxis_title="Defunciones",
-        margin=dict(l=10, r=10, t=60, b=100),
+    return build_figure(
+        [
+            {
+                "type": "bar",
+                "x": counts["grupo_edad_label"].to_numpy(),
+                "y": counts["total"].to_numpy(),
+                "marker": {"color": "#2471a3"},
+                "hovertemplate": "%{x}<br>%{y:,} defunciones<extra></extra>",
+            }
+        ],
+        {
+            "title": {"text": title},
+            "xaxis": {
+                "title": {"text": "Grupo de edad"},
+                "categoryorder": "array",
+                "categoryarray": AGE_ORDER,
+                "tickangle": -35,
+            },
+            "yaxis": {"title": {"text": "Defunciones"}, "tickformat": ","},
+            "margin": {"l": 10, "r": 10, "t": 60, "b": 100},
+        },
     )
-    figure.update_xaxes(tickangle=-35)
-    figure.update_yaxes(tickformat=",")
-    return figure
 
 
 def render(data: pd.DataFrame | None = None, title: str | None = None) -> html.Div:
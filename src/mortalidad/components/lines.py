@@ -3,63 +3,51 @@
 from __future__ import annotations
 
 import pandas as pd
-import plotly.express as px
 from dash import dcc, html
 from plotly.graph_objects import Figure
 
+from mortalidad.components.figures import build_figure, empty_figure
+from mortalidad.data_loader import MONTH_LABELS
+
 
 def build_monthly_line_figure(
     data: pd.DataFrame,
     *,
+    counts: pd.DataFrame | None = None,
     title: str = "Muertes por mes",
 ) -> Figure:
-    """Build a line chart summarising deaths per month."""
+    """Build a line chart summarising deaths per month.
+
+    ``counts`` may hold the per-month totals already computed by the caller.
+    """
     required = {"anio", "mes", "causa_cod"}
     if data.empty or not required.issubset(data.columns):
-        figure = Figure()
-        figure.update_layout(
-            template="plotly_white",
-            title=title,
-            annotations=[
-                dict(
-                    text="Sin datos para filtros seleccionados",
-                    x=0.5,
-                    y=0.5,
-                    xref="paper",
-                    yref="paper",
-                    showarrow=False,
-                    font=dict(color="#5f6b7a"),
-                )
-            ],
-        )
-        return figure
+        return empty_figure(title)
 
-    monthly = (
-        data.groupby(["anio", "mes"], as_index=False)
-        .agg(total=("causa_cod", "size"))
-        .sort_values(["anio", "mes"])
-    )
-    monthly["mes_label"] = monthly["mes"].map(lambda m: f"{m:02d}")
+    if counts is None:
+        counts = (
+            data.groupby(["anio", "mes"], sort=False).size().reset_index(name="total")
+        )
+    monthly = counts.sort_values(["anio", "mes"])
 
-    figure = px.line(
-        monthly,
-        x="mes_label",
-        y="total",
-        markers=True,
-        title=title,
-    )
-    figure.update_traces(
-        hovertemplate="Mes %{x}: %{y:,} defunciones<extra></extra>",
-        line_shape="linear",
-    )
-    figure.update_layout(
-        template="plotly_white",
-        xaxis_title="Mes",
-        yaxis_title="Defunciones",
-        margin=dict(l=10, r=10, t=60, b=40),
+    return build_figure(
+        [
+            {
+                "type": "scatter",
+                "mode": "lines+markers",
+                "x": MONTH_LABELS[monthly["mes"].to_numpy()],
+                "y": monthly["total"].to_numpy(),
+                "line": {"shape": "linear"},
+                "hovertemplate": "Mes %{x}: %{y:,} defunciones<extra></extra>",
+            }
+        ],
+        {
+            "title": {"text": title},
+            "xaxis": {"title": {"text": "Mes"}},
+            "yaxis": {"title": {"text": "Defunciones"}, "tickformat": ","},
+            "margin": {"l": 10, "r": 10, "t": 60, "b": 40},
+        },
     )
-    figure.update_yaxes(tickformat=",")
-    return figure
 
 
 def render(data: pd.DataFrame | None = None, title: str | None = None) -> html.Div:
@@ -2,28 +2,63 @@
 
 from __future__ import annotations
 
+import re
 from functools import lru_cache
 from pathlib import Path
 from typing import Any, cast
 
+import numpy as np
+import numpy.typing as npt
 import pandas as pd
 import plotly.graph_objects as go
 from dash import dcc, html
+from pandas.api.types import is_numeric_dtype
 
 from ..config import get_settings
+from ..data_loader import get_string_dtype, read_with_parquet_sidecar
+from .figures import empty_figure
 
 SETTINGS = get_settings()
 
 
-def _normalize_code(value: object, width: int) -> str:
-    text = "" if value is None else str(value).strip()
-    digits = "".join(char for char in text if char.isdigit())
-    return digits.zfill(width)
+_NON_DIGITS = re.compile(r"\D+")
+_REFERENCE_TEXT_COLUMNS = ("depto_cod", "muni_cod", "depto", "municipio")
+
+
+def _normalize_codes(codes: pd.Series, width: int) -> pd.Series:
+    """Keep only the digits of each code and left-pad them to ``width``."""
+    return codes.fillna("").str.replace(_NON_DIGITS, "", regex=True).str.zfill(width)
+
+
+def _read_reference_csv(csv_path: Path) -> pd.DataFrame:
+    """Parse and normalize the DANE municipality coordinates CSV."""
+    coords = pd.read_csv(csv_path, dtype=str, encoding="utf-8")
+    coords = coords.rename(
+        columns={
+            "COD_DPTO": "depto_cod",
+            "NOM_DPTO": "depto",
+            "COD_MPIO": "muni_cod",
+            "NOM_MPIO": "municipio",
+            "LATITUD": "lat",
+            "LONGITUD": "lon",
+        }
+    )
+    coords["depto_cod"] = _normalize_codes(coords["depto_cod"], width=2)
+    coords["muni_cod"] = _normalize_codes(coords["muni_cod"], width=5)
+    coords["depto"] = coords["depto"].str.strip().str.title()
+    coords["municipio"] = coords["municipio"].str.strip().str.title()
+    coords["lat"] = pd.to_numeric(coords["lat"], errors="coerce")
+    coords["lon"] = pd.to_numeric(coords["lon"], errors="coerce")
+    return coords.dropna(subset=["lat", "lon"]).reset_index(drop=True)
 
 
 @lru_cache(maxsize=1)
 def _reference_coordinates() -> pd.DataFrame:
-    """Load static municipality coordinates as a fallback for missing values."""
+    """Load static municipality coordinates as a fallback for missing values.
+
+    The normalized table is kept as a Parquet sidecar in the processed data
+    directory, so later processes skip the CSV parse.
+    """
     settings = get_settings()
     candidates = [
         settings.data_dir / "dane_municipios.csv",
@@ -37,86 +72,106 @@ def _reference_coordinates() -> pd.DataFrame:
     if csv_path is None:
         return pd.DataFrame(columns=["muni_cod", "lat", "lon", "depto", "depto_cod"])
 
-    coords = pd.read_csv(csv_path, dtype=str, encoding="utf-8")
-    coords = coords.rename(
-        columns={
-            "COD_DPTO": "depto_cod",
-            "NOM_DPTO": "depto",
-            "COD_MPIO": "muni_cod",
-            "NOM_MPIO": "municipio",
-            "LATITUD": "lat",
-            "LONGITUD": "lon",
-        }
-    )
-    coords["depto_cod"] = coords["depto_cod"].map(
-        lambda value: _normalize_code(value, width=2)
-    )
-    coords["muni_cod"] = coords["muni_cod"].map(
-        lambda value: _normalize_code(value, width=5)
-    )
-    coords["depto"] = coords["depto"].astype("string").str.strip().str.title()
-    coords["municipio"] = coords["municipio"].astype("string").str.strip().str.title()
-    coords["lat"] = pd.to_numeric(coords["lat"], errors="coerce")
-    coords["lon"] = pd.to_numeric(coords["lon"], errors="coerce")
-    return coords.dropna(subset=["lat", "lon"])
+    sidecar = settings.data_dir.parent / "processed" / "dane_municipios.parquet"
+    coords = read_with_parquet_sidecar(csv_path, sidecar, _read_reference_csv)
+    # Parquet does not record the string storage, so it is applied on every read.
+    string_dtype = get_string_dtype()
+    return coords.astype(dict.fromkeys(_REFERENCE_TEXT_COLUMNS, string_dtype))
 
 
-def _fill_missing_coordinates(data: pd.DataFrame) -> pd.DataFrame:
-    """Return a copy of the dataset with missing coordinates filled when possible."""
-    dataset = data.copy()
-    dataset["lat"] = pd.to_numeric(dataset.get("lat"), errors="coerce")
-    dataset["lon"] = pd.to_numeric(dataset.get("lon"), errors="coerce")
+@lru_cache(maxsize=1)
+def _reference_lookup() -> pd.DataFrame:
+    """Return the reference coordinates indexed by municipality code."""
+    reference = _reference_coordinates().drop_duplicates("muni_cod")
+    return reference.set_index("muni_cod")[["lat", "lon"]]
+
+
+def _lookup_positions(codes: pd.Series, index: pd.Index) -> npt.NDArray[np.intp]:
+    """Return the position of each code in ``index``, ``-1`` when absent.
+
+    Categorical codes are resolved once per category instead of once per row.
+    """
+    if isinstance(codes.dtype, pd.CategoricalDtype):
+        categories = np.append(index.get_indexer(codes.dtype.categories), -1)
+        return cast(npt.NDArray[np.intp], categories[codes.cat.codes.to_numpy()])
+    return cast(npt.NDArray[np.intp], index.get_indexer(codes))
 
-    if {"muni_cod"}.issubset(dataset.columns):
-        reference = _reference_coordinates()
+
+def _fill_missing_coordinates(data: pd.DataFrame) -> pd.DataFrame:
+    """Return the dataset with missing coordinates filled when possible.
+
+    The input is never modified; ``assign`` builds a new frame that, under
+    copy-on-write, shares the untouched columns instead of copying them.
+    Frames whose numeric coordinates are already complete are returned as-is.
+    """
+    if all(
+        column in data.columns
+        and is_numeric_dtype(data[column])
+        and data[column].notna().all()
+        for column in ("lat", "lon")
+    ):
+        return data
+
+    missing = pd.Series(np.nan, index=data.index)
+    lat = pd.to_numeric(data.get("lat", missing), errors="coerce")
+    lon = pd.to_numeric(data.get("lon", missing), errors="coerce")
+
+    if "muni_cod" in data.columns:
+        reference = _reference_lookup()
         if not reference.empty:
-            dataset = dataset.merge(
-                reference[["muni_cod", "lat", "lon"]],
-                on="muni_cod",
-                how="left",
-                suffixes=("", "_ref"),
-            )
-            dataset["lat"] = dataset["lat"].fillna(dataset["lat_ref"])
-            dataset["lon"] = dataset["lon"].fillna(dataset["lon_ref"])
-            dataset = dataset.drop(
-                columns=[col for col in dataset.columns if col.endswith("_ref")]
-            )
+            positions = _lookup_positions(data["muni_cod"], reference.index)
+            # Position -1 picks the trailing NaN for codes without a reference.
+            ref_lat = np.append(reference["lat"].to_numpy(dtype=float), np.nan)
+            ref_lon = np.append(reference["lon"].to_numpy(dtype=float), np.nan)
+            lat = lat.fillna(pd.Series(ref_lat[positions], index=data.index))
+            lon = lon.fillna(pd.Series(ref_lon[positions], index=data.index))
 
-    return dataset
+    return data.assign(lat=lat, lon=lon)
 
 
-def _compute_bounds(data: pd.DataFrame) -> tuple[float, float, float, float]:
-    """Return latitude and longitude bounds with a safety margin."""
-    lat_min = float(data["lat"].min())
-    lat_max = float(data["lat"].max())
-    lon_min = float(data["lon"].min())
-    lon_max = float(data["lon"].max())
+def _compute_bounds(
+    data: pd.DataFrame,
+) -> tuple[tuple[float, float, float, float], tuple[float, float]]:
+    """Return padded latitude/longitude bounds and the mean centre of the points.
+
+    The reductions run column-wise over a single ``(n, 2)`` coordinate array
+    instead of six separate Series reductions.
+    """
+    coordinates = data[["lat", "lon"]].to_numpy(dtype=np.float64)
+    lat_min, lon_min = coordinates.min(axis=0).tolist()
+    lat_max, lon_max = coordinates.max(axis=0).tolist()
+    center_lat, center_lon = coordinates.mean(axis=0).tolist()
     lat_margin = max(0.8, (lat_max - lat_min) * 0.2)
     lon_margin = max(0.8, (lon_max - lon_min) * 0.2)
     return (
-        lat_min - lat_margin,
-        lat_max + lat_margin,
-        lon_min - lon_margin,
-        lon_max + lon_margin,
+        (
+            lat_min - lat_margin,
+            lat_max + lat_margin,
+            lon_min - lon_margin,
+            lon_max + lon_margin,
+        ),
+        (center_lat, center_lon),
     )
 
 
 def _marker_sizes(
     totals: pd.Series, *, min_size: float = 8.0, max_size: float = 28.0
-) -> list[float]:
+) -> npt.NDArray[np.float64]:
     """Scale bubble sizes proportionally to the totals."""
-    if totals.empty:
-        return []
-    min_total = float(totals.min())
-    max_total = float(totals.max())
+    values: npt.NDArray[np.float64] = totals.to_numpy(dtype=np.float64)
+    if values.size == 0:
+        return values
+    min_total = float(values.min())
+    max_total = float(values.max())
     if max_total <= 0:
-        return [min_size] * len(totals)
+        return np.full(values.size, min_size)
     if max_total == min_total:
-        midpoint = (min_size + max_size) / 2
-        return [midpoint] * len(totals)
-    normalized = (totals - min_total) / (max_total - min_total)
-    scaled = min_size + normalized * (max_size - min_size)
-    return cast(list[float], scaled.tolist())
+        return np.full(values.size, (min_size + max_size) / 2)
+    scaled = values - min_total
+    scaled /= max_total - min_total
+    scaled *= max_size - min_size
+    scaled += min_size
+    return scaled
 
 
 def _estimate_zoom(
@@ -130,33 +185,39 @@ def _estimate_zoom(
     return max(4.0, min(6.2, zoom))
 
 
-def _aggregate_by_department(data: pd.DataFrame) -> pd.DataFrame:
-    """Aggregate records by department computing totals and centroid averages."""
-    return (
-        data.groupby(["depto_cod", "depto"], dropna=False, as_index=False)
-        .agg(
-            total=("causa_cod", "size"),
-            lat=("lat", "mean"),
-            lon=("lon", "mean"),
-        )
-        .sort_values("total", ascending=False)
+def _aggregate_by_municipality(data: pd.DataFrame) -> pd.DataFrame:
+    """Aggregate records by municipality to provide more granular markers.
+
+    The coordinate counts let :func:`_aggregate_by_department` roll the
+    centroids up without grouping the raw rows a second time.
+    """
+    return data.groupby(
+        ["depto_cod", "depto", "muni_cod", "municipio"],
+        dropna=False,
+        as_index=False,
+        observed=True,
+    ).agg(
+        total=("lat", "size"),
+        lat=("lat", "mean"),
+        lon=("lon", "mean"),
+        lat_count=("lat", "count"),
+        lon_count=("lon", "count"),
     )
 
 
-def _aggregate_by_municipality(data: pd.DataFrame) -> pd.DataFrame:
-    """Aggregate records by municipality to provide more granular markers."""
-    return (
-        data.groupby(
-            ["depto_cod", "depto", "muni_cod", "municipio"],
-            dropna=False,
-            as_index=False,
-        )
-        .agg(
-            total=("causa_cod", "size"),
-            lat=("lat", "mean"),
-            lon=("lon", "mean"),
-        )
-        .sort_values("total", ascending=True)
+def _aggregate_by_department(municipalities: pd.DataFrame) -> pd.DataFrame:
+    """Roll municipality aggregates up to department totals and centroids."""
+    weighted = municipalities.assign(
+        lat=municipalities["lat"] * municipalities["lat_count"],
+        lon=municipalities["lon"] * municipalities["lon_count"],
+    )
+    departments = weighted.groupby(
+        ["depto_cod", "depto"], dropna=False, as_index=False, observed=True
+    )[["total", "lat", "lon", "lat_count", "lon_count"]].sum()
+    departments["lat"] = departments["lat"] / departments["lat_count"]
+    departments["lon"] = departments["lon"] / departments["lon_count"]
+    return departments[["depto_cod", "depto", "total", "lat", "lon"]].sort_values(
+        "total", ascending=False
     )
 
 
@@ -167,59 +228,21 @@ def build_choropleth_figure(
     title: str = "Mapa coroplético por departamento",
 ) -> go.Figure:
     """Return a choropleth or scattergeo map describing mortality by department."""
-    if data.empty:
-        fig = go.Figure()
-        fig.update_layout(
-            template="plotly_white",
-            title=title,
-            annotations=[
-                dict(
-                    text="Sin datos para filtros seleccionados",
-                    x=0.5,
-                    y=0.5,
-                    xref="paper",
-                    yref="paper",
-                    showarrow=False,
-                    font=dict(color="#5f6b7a"),
-                )
-            ],
-        )
-        return fig
+    # ``lat``/``lon`` are not required: the coordinate fill always provides them.
+    required = {"depto_cod", "depto", "muni_cod", "municipio", "causa_cod"}
+    if data.empty or not required.issubset(data.columns):
+        return empty_figure(title)
 
     dataset = _fill_missing_coordinates(data)
 
-    required = {
-        "depto_cod",
-        "depto",
-        "muni_cod",
-        "municipio",
-        "lat",
-        "lon",
-        "causa_cod",
-    }
-    if not required.issubset(dataset.columns):
-        fig = go.Figure()
-        fig.update_layout(
-            template="plotly_white",
-            title=title,
-            annotations=[
-                dict(
-                    text="Sin datos para filtros seleccionados",
-                    x=0.5,
-                    y=0.5,
-                    xref="paper",
-                    yref="paper",
-                    showarrow=False,
-                    font=dict(color="#5f6b7a"),
-                )
-            ],
-        )
-        return fig
-
-    dept_aggregated = _aggregate_by_department(dataset)
+    municipalities = _aggregate_by_municipality(dataset)
+    dept_aggregated = _aggregate_by_department(municipalities)
     dept_aggregated = dept_aggregated.dropna(subset=["lat", "lon"])
-    muni_aggregated = _aggregate_by_municipality(dataset)
-    muni_aggregated = muni_aggregated.dropna(subset=["lat", "lon"])
+    muni_aggregated = (
+        municipalities.drop(columns=["lat_count", "lon_count"])
+        .sort_values("total", ascending=True)
+        .dropna(subset=["lat", "lon"])
+    )
 
     if muni_aggregated.empty and not dept_aggregated.empty:
         muni_aggregated = dept_aggregated.assign(
@@ -228,30 +251,14 @@ def build_choropleth_figure(
         )
 
     if dept_aggregated.empty and muni_aggregated.empty:
-        fig = go.Figure()
-        fig.update_layout(
-            template="plotly_white",
-            title=title,
-            annotations=[
-                dict(
-                    text="Sin datos para filtros seleccionados",
-                    x=0.5,
-                    y=0.5,
-                    xref="paper",
-                    yref="paper",
-                    showarrow=False,
-                    font=dict(color="#5f6b7a"),
-                )
-            ],
-        )
-        return fig
+        return empty_figure(title)
 
     reference_for_bounds = (
         muni_aggregated if not muni_aggregated.empty else dept_aggregated
     )
-    lat_min, lat_max, lon_min, lon_max = _compute_bounds(reference_for_bounds)
-    center_lat = float(reference_for_bounds["lat"].mean())
-    center_lon = float(reference_for_bounds["lon"].mean())
+    (lat_min, lat_max, lon_min, lon_max), (center_lat, center_lon) = _compute_bounds(
+        reference_for_bounds
+    )
     zoom = _estimate_zoom(lat_min, lat_max, lon_min, lon_max)
 
     figure = go.Figure()
@@ -288,10 +295,14 @@ def build_choropleth_figure(
         marker_sizes = _marker_sizes(
             muni_aggregated["total"], min_size=size_min, max_size=size_max
         )
-        hover_text = [
-            f"{row.municipio} ({row.depto})<br>Total: {row.total:,} muertes"
-            for row in muni_aggregated.itertuples()
-        ]
+        hover_text = (
+            muni_aggregated["municipio"].astype(str)
+            + " ("
+            + muni_aggregated["depto"].astype(str)
+            + ")<br>Total: "
+            + muni_aggregated["total"].map("{:,}".format)
+            + " muertes"
+        ).to_numpy()
         total_min = float(muni_aggregated["total"].min())
         total_max = float(muni_aggregated["total"].max())
         showscale = total_max != total_min and not show_department_layer
@@ -3,64 +3,54 @@
 from __future__ import annotations
 
 import pandas as pd
-import plotly.express as px
 from dash import dcc, html
 from plotly.graph_objects import Figure
 
+from mortalidad.components.figures import build_figure, empty_figure
+
 
 def build_lowest_mortality_pie(
     data: pd.DataFrame,
     *,
+    counts: pd.DataFrame | None = None,
     top_n: int = 10,
     title: str = "10 ciudades con menor mortalidad",
 ) -> Figure:
-    """Return a pie chart with the cities that have the lowest mortality counts."""
+    """Return a pie chart with the cities that have the lowest mortality counts.
+
+    ``counts`` may hold the per-municipality totals already computed.
+    """
     required = {"municipio", "muni_cod", "causa_cod"}
     if data.empty or not required.issubset(data.columns):
-        figure = Figure()
-        figure.update_layout(
-            template="plotly_white",
-            title=title,
-            annotations=[
-                dict(
-                    text="Sin datos para filtros seleccionados",
-                    x=0.5,
-                    y=0.5,
-                    xref="paper",
-                    yref="paper",
-                    showarrow=False,
-                    font=dict(color="#5f6b7a"),
-                )
-            ],
-        )
-        return figure
+        return empty_figure(title)
 
-    totals = (
-        data.groupby(["muni_cod", "municipio"], as_index=False)
-        .agg(total=("causa_cod", "size"))
-        .sort_values("total", ascending=True)
-        .head(top_n)
-    )
-    figure = px.pie(
-        totals,
-        names="municipio",
-        values="total",
-        title=title,
-        hole=0.35,
-    )
-    figure.update_traces(
-        textinfo="label+percent",
-        hovertemplate=(
-            "%{label}<br>Total: %{value:,} muertes (%{percent})<extra></extra>"
-        ),
-    )
-    figure.update_layout(
-        template="plotly_white",
-        margin=dict(l=10, r=10, t=60, b=10),
-        height=360,
-        legend_title="Municipio",
+    if counts is None:
+        counts = (
+            data.groupby(["muni_cod", "municipio"], observed=True)
+            .size()
+            .reset_index(name="total")
+        )
+    totals = counts.sort_values(["total", "muni_cod"]).head(top_n)
+    return build_figure(
+        [
+            {
+                "type": "pie",
+                "labels": totals["municipio"].to_numpy(),
+                "values": totals["total"].to_numpy(),
+                "hole": 0.35,
+                "textinfo": "label+percent",
+                "hovertemplate": (
+                    "%{label}<br>Total: %{value:,} muertes (%{percent})<extra></extra>"
+                ),
+            }
+        ],
+        {
+            "title": {"text": title},
+            "legend": {"title": {"text": "Municipio"}},
+            "margin": {"l": 10, "r": 10, "t": 60, "b": 10},
+            "height": 360,
+        },
     )
-    return figure
 
 
 def render(data: pd.DataFrame | None = None, title: str | None = None) -> html.Div:
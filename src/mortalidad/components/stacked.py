@@ -9,60 +9,55 @@ import plotly.graph_objects as go
 from dash import dcc, html
 from plotly.graph_objects import Figure
 
+from mortalidad.components.figures import empty_figure
+
+_SEX_PRIORITY = {"F": 0, "M": 1, "NR": 2}
+
 
 def _order_sexes(sexes: Iterable[str]) -> list[str]:
-    order = ["F", "M", "NR"]
-    sex_list = [sex for sex in order if sex in sexes]
-    for sex in sexes:
-        if sex not in sex_list:
-            sex_list.append(sex)
-    return sex_list
+    # ``sorted`` is stable, so unknown codes keep their order after the known ones.
+    return sorted(
+        dict.fromkeys(sexes), key=lambda sex: _SEX_PRIORITY.get(sex, len(_SEX_PRIORITY))
+    )
 
 
 def build_stacked_bar_figure(
     data: pd.DataFrame,
     *,
+    counts: pd.DataFrame | None = None,
     normalize: bool = False,
     title: str = "Muertes por sexo y departamento",
 ) -> Figure:
-    """Return a stacked (or normalized) bar chart by sex."""
+    """Return a stacked (or normalized) bar chart by sex.
+
+    ``counts`` may hold the per-department and sex totals already computed.
+    """
     required = {"depto", "sexo", "causa_cod"}
     if data.empty or not required.issubset(data.columns):
-        figure = Figure()
-        figure.update_layout(
-            template="plotly_white",
-            title=title,
-            annotations=[
-                dict(
-                    text="Sin datos para filtros seleccionados",
-                    x=0.5,
-                    y=0.5,
-                    xref="paper",
-                    yref="paper",
-                    showarrow=False,
-                    font=dict(color="#5f6b7a"),
-                )
-            ],
-        )
-        return figure
+        return empty_figure(title)
 
-    grouped = (
-        data.groupby(["depto", "sexo"], as_index=False)
-        .agg(total=("causa_cod", "size"))
-        .sort_values(["depto", "sexo"])
-    )
+    if counts is None:
+        counts = (
+            data.groupby(["depto", "sexo"], observed=True, sort=False)
+            .size()
+            .reset_index(name="total")
+        )
+    grouped = counts.sort_values(["depto", "sexo"])
 
-    departments = grouped["depto"].unique().tolist()
-    sexes = _order_sexes(grouped["sexo"].unique().tolist())
+    departments = grouped["depto"].unique()
+    sexes = _order_sexes(grouped["sexo"].unique())
 
     figure = go.Figure()
     display_names = {"M": "Hombres", "F": "Mujeres", "NR": "No reportado"}
+    matrix = (
+        grouped.set_index(["depto", "sexo"])["total"]
+        .unstack(fill_value=0)
+        .reindex(index=departments, columns=sexes, fill_value=0)
+    )
     for sex in sexes:
-        subset = grouped[grouped["sexo"] == sex]
-        y_values = subset.set_index("depto")["total"].reindex(departments, fill_value=0)
         figure.add_bar(
             x=departments,
-            y=y_values,
+            y=matrix[sex].to_numpy(),
             name=display_names.get(sex, sex),
             hovertemplate="%{x}<br>%{y:,} defunciones<extra></extra>",
         )
@@ -2,8 +2,6 @@
 
 from __future__ import annotations
 
-from typing import cast
-
 import pandas as pd
 from dash import dash_table, html
 
@@ -15,12 +13,21 @@ def top_causes_records(
     if data.empty:
         return []
     aggregated = (
-        data.groupby(["causa_cod", "causa"], as_index=False)
-        .agg(total=("causa_cod", "size"))
-        .sort_values("total", ascending=False)
+        data.groupby(["causa_cod", "causa"], observed=True)
+        .size()
+        .reset_index(name="total")
+        .sort_values(["total", "causa_cod"], ascending=[False, True])
         .head(limit)
     )
-    return cast(list[dict[str, object]], aggregated.to_dict("records"))
+    return [
+        {"causa_cod": code, "causa": cause, "total": total}
+        for code, cause, total in zip(
+            aggregated["causa_cod"].tolist(),
+            aggregated["causa"].tolist(),
+            aggregated["total"].tolist(),
+            strict=True,
+        )
+    ]
 
 
 def build_top_causes_table(
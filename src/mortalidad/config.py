@@ -1,43 +1,61 @@
-"""Configuration management using Pydantic Settings."""
+"""Configuration management from environment variables and `.env`."""
 
 from __future__ import annotations
 
+import os
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
+from typing import Any
 
-from pydantic import field_validator
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from dotenv import dotenv_values
 
+ENV_FILE = ".env"
 
-class Settings(BaseSettings):
+_CONVERTERS: dict[str, Callable[[str], Any]] = {
+    "env": str,
+    "port": int,
+    "cache_timeout": int,
+    "cache_dir": Path,
+    "mapbox_token": str,
+    "data_dir": Path,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
     """Application settings loaded from environment variables or `.env`."""
 
     env: str = "development"
     port: int = 8050
     cache_timeout: int = 300
+    cache_dir: Path | None = None
     mapbox_token: str | None = None
     data_dir: Path = Path("data/raw")
 
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_prefix="",
-        case_sensitive=False,
-    )
-
-    @field_validator("env")
-    @classmethod
-    def _validate_env(cls, value: str) -> str:
-        normalized = value.lower().strip()
+    def __post_init__(self) -> None:
+        normalized = self.env.lower().strip()
         if normalized not in {"development", "dev", "production", "prod"}:
             raise ValueError("ENV debe ser 'development'/'dev' o 'production'/'prod'.")
-        return normalized
+        object.__setattr__(self, "env", normalized)
+        if not self.data_dir.exists():
+            self.data_dir.mkdir(parents=True, exist_ok=True)
 
-    @field_validator("data_dir")
     @classmethod
-    def _validate_data_dir(cls, value: Path) -> Path:
-        if not value.exists():
-            value.mkdir(parents=True, exist_ok=True)
-        return value
+    def from_mapping(cls, values: Mapping[str, str]) -> Settings:
+        """Build settings from case-insensitive ``NAME=value`` string pairs.
+
+        Missing or empty values keep the field default.
+        """
+        lowered = {key.lower(): value for key, value in values.items()}
+        return cls(
+            **{
+                name: convert(lowered[name])
+                for name, convert in _CONVERTERS.items()
+                if lowered.get(name)
+            }
+        )
 
     @property
     def is_development(self) -> bool:
@@ -52,8 +70,17 @@ class Settings(BaseSettings):
 
 @lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Return cached settings instance to avoid repeated parsing."""
-    return Settings()
+    """Return cached settings instance to avoid repeated parsing.
+
+    Environment variables take precedence over values from `.env`.
+    """
+    values = {
+        key: value
+        for key, value in dotenv_values(ENV_FILE).items()
+        if value is not None
+    }
+    values.update(os.environ)
+    return Settings.from_mapping(values)
 
 
 __all__ = ["Settings", "get_settings"]
@@ -2,13 +2,21 @@
 
 from __future__ import annotations
 
+import json
 import logging
+import os
 import sys
-from collections.abc import Iterable
+import threading
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from datetime import date
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 
 import numpy as np
+import numpy.typing as npt
 import pandas as pd
 
 if getattr(np, "string_", None) is None:
@@ -34,6 +42,7 @@ RAW_FILENAMES = {
     "divipola": "Divipola.xlsx",
 }
 CACHE_FILENAME = "mortalidad_2019.parquet"
+VALIDATION_STAMP_SUFFIX = ".schema_ok"
 
 RECORDS_COLUMN_MAP = {
     "DPTO_OCURRE": "depto_cod",
@@ -51,6 +60,9 @@ RECORDS_COLUMN_MAP = {
     "COD_MUERTE": "causa_cod",
 }
 
+# Raw record columns read by ``_prepare_records``; everything else is skipped.
+RECORDS_SOURCE_COLUMNS = frozenset(RECORDS_COLUMN_MAP) | {"AÑO", "MES", "COD_DANE"}
+
 CAUSES_COLUMN_MAP = {
     "CODIGO": "causa_cod",
     "COD_CAUSA": "causa_cod",
@@ -73,8 +85,46 @@ DIVIPOLA_COLUMN_MAP = {
     "LONGITUD": "lon",
 }
 
+DIVIPOLA_FILL_COLUMNS = ("depto", "municipio", "lat", "lon")
+
 ALLOWED_SEXES = {"M", "F", "NR"}
 
+# Every allowed code maps to itself, so unmapped values can default to ``NR``.
+SEX_MAP = {
+    "MASCULINO": "M",
+    "HOMBRE": "M",
+    "1": "M",
+    "FEMENINO": "F",
+    "MUJER": "F",
+    "2": "F",
+    "F": "F",
+    "M": "M",
+    "3": "NR",
+    "9": "NR",
+    "SIN INFORMACION": "NR",
+    "SIN INFORMACIÓN": "NR",
+    "NR": "NR",
+    "0": "NR",
+}
+
+CATEGORICAL_COLUMNS = (
+    "depto_cod",
+    "muni_cod",
+    "depto",
+    "municipio",
+    "sexo",
+    "grupo_edad_label",
+    "causa_cod",
+    "causa",
+)
+
+NARROW_INTEGER_COLUMNS: dict[str, str] = {
+    "mes": "int8",
+    "homicidio_x95": "int8",
+    "grupo_edad": "int8",
+    "anio": "int16",
+}
+
 GRUPO_EDAD_LABELS: dict[int, str] = {
     1: "Menor de 1 año",
     2: "1 a 4 años",
@@ -90,6 +140,20 @@ GRUPO_EDAD_LABELS: dict[int, str] = {
     12: "75 años o más",
 }
 
+# Age labels in chronological order, so sorting the column follows the groups.
+GRUPO_EDAD_DTYPE = pd.CategoricalDtype(list(GRUPO_EDAD_LABELS.values()), ordered=True)
+
+# Age labels indexed directly by group number; 0 and 13 take every other value.
+_GRUPO_EDAD_LABEL_LOOKUP: npt.NDArray[np.object_] = np.array(
+    ["Sin clasificación", *GRUPO_EDAD_LABELS.values(), "Sin clasificación"],
+    dtype=object,
+)
+
+# Zero-padded month labels indexed directly by month number (index 0 unused).
+MONTH_LABELS: npt.NDArray[np.object_] = np.array(
+    [f"{month:02d}" for month in range(13)], dtype=object
+)
+
 MORTALITY_SCHEMA = DataFrameSchema(
     {
         "depto_cod": Column(str, checks=Check.str_length(2, 5)),
@@ -120,55 +184,61 @@ class _SettingsSnapshot:
 
 
 def _normalize_code(series: pd.Series, width: int) -> pd.Series:
-    return (
-        series.astype("string")
+    """Strip a float ``.0`` suffix and left-pad codes with zeros to ``width``.
+
+    Only the distinct raw codes are cleaned, each step as a single
+    ``pyarrow.compute`` kernel on Arrow-backed strings; missing codes (-1) pick
+    the trailing all-zero code.
+    """
+    positions, values = pd.factorize(series)
+    normalized = (
+        pd.Series(values, dtype=object)
+        .astype(_STRING_DTYPE)
         .str.strip()
-        .str.replace(".0", "", regex=False)
         .str.replace(r"\.0$", "", regex=True)
-        .fillna("")
-        .str.zfill(width)
+        .str.pad(width, side="left", fillchar="0")
     )
+    codes = np.append(normalized.to_numpy(dtype=object), "0" * width)[positions]
+    return pd.Series(codes, index=series.index, dtype=_STRING_DTYPE)
 
 
-def _normalize_sex(value: object) -> str:
-    if value is None:
-        return "NR"
-    text = str(value).strip().upper()
-    mapping = {
-        "MASCULINO": "M",
-        "HOMBRE": "M",
-        "1": "M",
-        "FEMENINO": "F",
-        "MUJER": "F",
-        "2": "F",
-        "F": "F",
-        "M": "M",
-        "3": "NR",
-        "9": "NR",
-        "SIN INFORMACION": "NR",
-        "SIN INFORMACIÓN": "NR",
-        "NR": "NR",
-        "0": "NR",
-    }
-    normalized = mapping.get(text, text)
-    if normalized not in ALLOWED_SEXES:
-        normalized = "NR"
-    return normalized
+def _normalize_sex(series: pd.Series) -> pd.Series:
+    """Map raw sex codes and labels to ``M``/``F``/``NR``; unknown values are ``NR``.
 
+    Only the distinct raw values are cleaned and mapped; missing values (-1)
+    pick the trailing ``NR``.
+    """
+    positions, values = pd.factorize(series)
+    text = pd.Series(values, dtype=object).astype(_STRING_DTYPE).str.strip().str.upper()
+    mapped = text.map(SEX_MAP).fillna("NR").to_numpy(dtype=object)
+    return pd.Series(np.append(mapped, "NR")[positions], index=series.index)
 
-def _read_excel(base_path: Path, filename: str) -> pd.DataFrame:
-    file_path = base_path / filename
-    if not file_path.exists():
-        raise FileNotFoundError(f"No se encontró el archivo requerido: {file_path}")
-    LOGGER.info("Leyendo archivo %s", file_path)
-    return pd.read_excel(file_path, engine="openpyxl")
+
+@lru_cache(maxsize=1)
+def get_excel_engine() -> str:
+    """Return the fastest available ``read_excel`` engine.
+
+    ``calamine`` parses workbooks in Rust; ``openpyxl`` remains the fallback.
+    """
+    try:
+        import python_calamine  # noqa: F401
+
+        return "calamine"
+    except ImportError:
+        return "openpyxl"
+
+
+def _read_workbook(path: Path, **options: object) -> pd.DataFrame:
+    return pd.read_excel(path, engine=get_excel_engine(), **options)
 
 
 def _latest_modification(paths: Iterable[Path]) -> float:
     return max(path.stat().st_mtime for path in paths if path.exists())
 
 
+@lru_cache(maxsize=1)
 def get_parquet_engine() -> str:
+    """Return the Parquet engine, resolved once per process."""
     if sys.version_info >= (3, 13):
         return "fastparquet"
     try:
@@ -179,6 +249,196 @@ def get_parquet_engine() -> str:
         return "fastparquet"
 
 
+def get_string_dtype() -> str:
+    """Return the pandas string dtype, backed by Arrow buffers when available."""
+    try:
+        import pyarrow  # noqa: F401
+
+        return "string[pyarrow]"
+    except ImportError:
+        return "string"
+
+
+_STRING_DTYPE = get_string_dtype()
+
+
+def _read_parquet(path: Path) -> pd.DataFrame:
+    engine = get_parquet_engine()
+    options = {"memory_map": True} if engine == "pyarrow" else {}
+    return pd.read_parquet(path, engine=engine, **options)
+
+
+def _write_parquet(frame: pd.DataFrame, path: Path) -> None:
+    """Write ``frame`` zstd-compressed in 64k-row groups.
+
+    The file is written next to ``path`` and moved into place, so concurrent
+    readers never see a partial file and a failed write leaves none behind.
+    """
+    engine = get_parquet_engine()
+    options: dict[str, object] = (
+        {"compression": "zstd", "row_group_size": 65_536, "use_dictionary": True}
+        if engine == "pyarrow"
+        else {"compression": "ZSTD", "row_group_offsets": 65_536}
+    )
+    # Unique per process and thread, as gunicorn workers and the loader's
+    # thread pool may write the same file at once.
+    temp_path = path.with_name(
+        f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+    )
+    try:
+        frame.to_parquet(temp_path, index=False, engine=engine, **options)
+        os.replace(temp_path, path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+
+def read_with_parquet_sidecar(
+    source: Path,
+    sidecar: Path,
+    reader: Callable[[Path], pd.DataFrame],
+    refresh: bool = False,
+) -> pd.DataFrame:
+    """Read ``source`` with ``reader``, caching the result as Parquet in ``sidecar``.
+
+    The sidecar is used while it is at least as new as ``source``; ``refresh``
+    ignores it and rewrites it from ``source``, as does a sidecar that cannot
+    be read. Failing to write it only costs the cache, so the error is logged
+    and ignored.
+    """
+    if (
+        not refresh
+        and sidecar.exists()
+        and sidecar.stat().st_mtime >= source.stat().st_mtime
+    ):
+        try:
+            return _read_parquet(sidecar)
+        except (OSError, ValueError) as exc:
+            LOGGER.warning("Caché ilegible %s, se relee %s: %s", sidecar, source, exc)
+    frame = reader(source)
+    try:
+        sidecar.parent.mkdir(parents=True, exist_ok=True)
+        _write_parquet(frame, sidecar)
+    except (OSError, TypeError, ValueError, ImportError) as exc:
+        LOGGER.warning("No se pudo guardar la caché %s: %s", sidecar, exc)
+    return frame
+
+
+def _parse_workbook(file_path: Path) -> pd.DataFrame:
+    LOGGER.info("Leyendo archivo %s", file_path)
+    frame = _read_workbook(file_path)
+    if all(str(col).startswith("Unnamed") for col in frame.columns):
+        LOGGER.info("Releyendo %s con encabezado en fila 9", file_path.name)
+        frame = _read_workbook(file_path, header=8)
+    return frame
+
+
+def _excel_cell(value: object) -> object:
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, date):
+        return pd.Timestamp(value)
+    return value
+
+
+def _excel_column(values: Sequence[object]) -> pd.Series:
+    """Type raw calamine cells the way ``read_excel`` does.
+
+    Empty cells become missing, integral floats integers and dates timestamps;
+    only columns that do not infer to a numeric dtype are converted per cell.
+    """
+    column = pd.Series(values, dtype=object)
+    column = column.mask(column == "").infer_objects()
+    if column.dtype == np.float64:
+        floats = column.to_numpy()
+        if np.isfinite(floats).all() and (floats % 1 == 0).all():
+            return column.astype(np.int64)
+    elif column.dtype == object:
+        column = pd.Series(
+            [_excel_cell(value) for value in column], dtype=object
+        ).infer_objects()
+    return column
+
+
+# _parse_workbook falls back to a header on row 9 (``header=8``).
+_RECORDS_HEADER_ROWS = 9
+
+
+def _parse_records_workbook(file_path: Path) -> pd.DataFrame:
+    """Read only :data:`RECORDS_SOURCE_COLUMNS`, streaming rows from calamine.
+
+    The header is the first row naming a source column; like
+    :func:`_parse_workbook`, it is looked for up to row 9. Without
+    python-calamine, or when no such row exists, the whole sheet is parsed by
+    :func:`_parse_workbook`.
+    """
+    try:
+        from python_calamine import CalamineWorkbook
+    except ImportError:
+        return _parse_workbook(file_path)
+    LOGGER.info("Leyendo archivo %s", file_path)
+    sheet = CalamineWorkbook.from_path(str(file_path)).get_sheet_by_index(0)
+    rows = sheet.iter_rows()
+    for row in islice(rows, _RECORDS_HEADER_ROWS):
+        header = [str(name) for name in row]
+        keep = [i for i, name in enumerate(header) if name in RECORDS_SOURCE_COLUMNS]
+        if keep:
+            break
+    else:
+        return _parse_workbook(file_path)
+    cells = [[row[i] for i in keep] for row in rows]
+    columns = list(zip(*cells, strict=True)) or [()] * len(keep)
+    return pd.DataFrame(
+        {
+            header[i]: _excel_column(values)
+            for i, values in zip(keep, columns, strict=True)
+        }
+    )
+
+
+def _read_excel(
+    base_path: Path,
+    filename: str,
+    parser: Callable[[Path], pd.DataFrame] = _parse_workbook,
+    refresh: bool = False,
+) -> pd.DataFrame:
+    """Return the parsed workbook, reusing its Parquet sidecar in ``processed``.
+
+    ``refresh`` re-parses the workbook and rewrites the sidecar.
+    """
+    file_path = base_path / filename
+    if not file_path.exists():
+        raise FileNotFoundError(f"No se encontró el archivo requerido: {file_path}")
+    sidecar = base_path.parent / "processed" / f"{file_path.stem}.parquet"
+    return read_with_parquet_sidecar(file_path, sidecar, parser, refresh=refresh)
+
+
+def _month_starts(years: pd.Series, months: pd.Series) -> pd.Series:
+    """Return the first day of each year/month pair, ``NaT`` when either is invalid.
+
+    Dates are built as months since the epoch; only the distinct offsets go
+    through the comparatively slow ``datetime64[M]`` to nanosecond conversion.
+    """
+    year = pd.to_numeric(years, errors="coerce").to_numpy(dtype=np.float64)
+    month = pd.to_numeric(months, errors="coerce").to_numpy(dtype=np.float64)
+    elapsed = (year - 1970) * 12 + month - 1
+    # Month starts representable as nanosecond timestamps.
+    first = (pd.Timestamp.min.year - 1970) * 12 + pd.Timestamp.min.month
+    last = (pd.Timestamp.max.year - 1970) * 12 + pd.Timestamp.max.month - 1
+    valid = (
+        (np.floor(year) == year)
+        & (np.floor(month) == month)
+        & (month >= 1)
+        & (month <= 12)
+        & (elapsed >= first)
+        & (elapsed <= last)
+    )
+    positions, offsets = pd.factorize(np.where(valid, elapsed, 0).astype(np.int64))
+    fecha = offsets.astype("datetime64[M]").astype("datetime64[ns]")[positions]
+    fecha[~valid] = np.datetime64("NaT")
+    return pd.Series(fecha, index=years.index)
+
+
 def _prepare_records(raw: pd.DataFrame) -> pd.DataFrame:
     standard_columns = {
         "depto_cod",
@@ -215,12 +475,14 @@ def _prepare_records(raw: pd.DataFrame) -> pd.DataFrame:
         available
     ):
         if "COD_DANE" in raw.columns:
-            muni_codes = raw["COD_DANE"].astype("string").str.strip()
+            muni_codes = raw["COD_DANE"].astype(_STRING_DTYPE).str.strip()
         else:
             dept_part = (
-                raw["COD_DEPARTAMENTO"].astype("string").str.strip().str.zfill(2)
+                raw["COD_DEPARTAMENTO"].astype(_STRING_DTYPE).str.strip().str.zfill(2)
+            )
+            muni_part = (
+                raw["COD_MUNICIPIO"].astype(_STRING_DTYPE).str.strip().str.zfill(3)
             )
-            muni_part = raw["COD_MUNICIPIO"].astype("string").str.strip().str.zfill(3)
             muni_codes = dept_part + muni_part
         records = pd.DataFrame(
             {
@@ -228,14 +490,7 @@ def _prepare_records(raw: pd.DataFrame) -> pd.DataFrame:
                 "muni_cod": muni_codes,
                 "sexo": raw.get("SEXO"),
                 "grupo_edad": raw.get("GRUPO_EDAD1"),
-                "fecha": pd.to_datetime(
-                    {
-                        "year": raw["AÑO"],
-                        "month": raw["MES"],
-                        "day": 1,
-                    },
-                    errors="coerce",
-                ),
+                "fecha": _month_starts(raw["AÑO"], raw["MES"]),
                 "causa_cod": raw["COD_MUERTE"],
             }
         )
@@ -252,24 +507,39 @@ def _prepare_records(raw: pd.DataFrame) -> pd.DataFrame:
             "registro de defunciones."
         )
 
-    records["depto_cod"] = _normalize_code(records["depto_cod"], width=2)
-    records["muni_cod"] = _normalize_code(records["muni_cod"], width=5)
-    records["causa_cod"] = records["causa_cod"].astype("string").str.strip().str.upper()
-    records["sexo"] = records["sexo"].apply(_normalize_sex)
-    records["grupo_edad"] = pd.to_numeric(records["grupo_edad"], errors="raise").astype(
-        "int16"
+    fecha = records["fecha"].dt.tz_localize(None)
+    grupo_edad = pd.to_numeric(records["grupo_edad"], errors="raise").astype("int16")
+    causa_cod = records["causa_cod"].astype(_STRING_DTYPE).str.strip().str.upper()
+    # Test the prefix once per distinct code; missing codes (-1) pick the final 0.
+    cause_positions, cause_codes = pd.factorize(causa_cod)
+    is_x95 = pd.Series(cause_codes).str.startswith("X95").to_numpy(dtype=np.int8)
+    homicidio_x95 = np.append(is_x95, np.int8(0))[cause_positions]
+    return records.assign(
+        depto_cod=_normalize_code(records["depto_cod"], width=2),
+        muni_cod=_normalize_code(records["muni_cod"], width=5),
+        causa_cod=causa_cod,
+        sexo=_normalize_sex(records["sexo"]),
+        grupo_edad=grupo_edad,
+        fecha=fecha,
+        anio=fecha.dt.year.astype("int16"),
+        mes=fecha.dt.month.astype("int16"),
+        grupo_edad_label=_GRUPO_EDAD_LABEL_LOOKUP[
+            np.clip(grupo_edad.to_numpy(), 0, len(GRUPO_EDAD_LABELS) + 1)
+        ],
+        homicidio_x95=homicidio_x95,
     )
 
-    records["fecha"] = records["fecha"].dt.tz_localize(None)
-    records["anio"] = records["fecha"].dt.year.astype("int16")
-    records["mes"] = records["fecha"].dt.month.astype("int16")
-    records["grupo_edad_label"] = (
-        records["grupo_edad"].map(GRUPO_EDAD_LABELS).fillna("Sin clasificación")
-    )
-    records["homicidio_x95"] = (
-        records["causa_cod"].str.startswith("X95", na=False).astype("int8")
-    )
-    return records
+
+def _text_column(frame: pd.DataFrame, column: str) -> pd.Series:
+    """Return ``column`` stripped, with missing cells or columns as ``""``."""
+    if column not in frame.columns:
+        return pd.Series("", index=frame.index, dtype=_STRING_DTYPE)
+    return frame[column].astype(_STRING_DTYPE).str.strip().fillna("")
+
+
+def _cause_entries(codes: pd.Series, descriptions: pd.Series) -> pd.DataFrame:
+    keep = (codes != "") & (codes.str.lower() != "nan")
+    return pd.DataFrame({"causa_cod": codes.str.upper(), "causa": descriptions})[keep]
 
 
 def _prepare_causes(raw: pd.DataFrame) -> pd.DataFrame:
@@ -280,27 +550,21 @@ def _prepare_causes(raw: pd.DataFrame) -> pd.DataFrame:
     desc4_col = "Descripcion  de códigos mortalidad a cuatro caracteres"
 
     if {code3_col, desc3_col}.issubset(columns):
-        records: list[dict[str, str]] = []
         cleaned = raw.dropna(how="all")
-        for _, row in cleaned.iterrows():
-            code3 = str(row.get(code3_col, "")).strip()
-            desc3 = str(row.get(desc3_col, "")).strip()
-            if code3 and code3.lower() != "nan":
-                records.append(
-                    {"causa_cod": code3.upper(), "causa": desc3 or "Sin descripción"}
-                )
-
-            code4 = str(row.get(code4_col, "")).strip()
-            desc4 = str(row.get(desc4_col, "")).strip()
-            if code4 and code4.lower() != "nan":
-                records.append(
-                    {
-                        "causa_cod": code4.upper(),
-                        "causa": desc4 or desc3 or "Sin descripción",
-                    }
-                )
-
-        causes = pd.DataFrame.from_records(records)
+        code3 = _text_column(cleaned, code3_col)
+        code4 = _text_column(cleaned, code4_col)
+        desc3 = _text_column(cleaned, desc3_col)
+        desc3 = desc3.mask(desc3 == "", "Sin descripción")
+        desc4 = _text_column(cleaned, desc4_col)
+        desc4 = desc4.mask(desc4 == "", desc3)
+        # A stable sort on the row labels lists each row's three-character
+        # entry before its four-character one, so duplicates resolve as before.
+        causes = (
+            pd.concat([_cause_entries(code3, desc3), _cause_entries(code4, desc4)])
+            .sort_index(kind="stable")
+            .reset_index(drop=True)
+            .astype(object)
+        )
         if causes.empty:
             raise ValueError(
                 "No se pudieron extraer códigos de la hoja de causas CIE-10."
@@ -318,11 +582,27 @@ def _prepare_causes(raw: pd.DataFrame) -> pd.DataFrame:
             f"Columnas faltantes en catálogo de causas: {set(missing_targets)}"
         )
     causes = renamed[required_columns].copy()
-    causes["causa_cod"] = causes["causa_cod"].astype("string").str.strip().str.upper()
-    causes["causa"] = causes["causa"].astype("string").str.strip()
+    causes["causa_cod"] = (
+        causes["causa_cod"].astype(_STRING_DTYPE).str.strip().str.upper()
+    )
+    causes["causa"] = causes["causa"].astype(_STRING_DTYPE).str.strip()
     return causes.drop_duplicates(subset="causa_cod")
 
 
+def _fill_from_catalog(frame: pd.DataFrame, catalog: pd.DataFrame) -> pd.DataFrame:
+    """Fill missing names and coordinates from the first matching catalog row.
+
+    Rows are matched on ``(depto_cod, muni_cod)`` through a unique index lookup,
+    so ``frame`` keeps its rows and order without a merge.
+    """
+    keys = ["depto_cod", "muni_cod"]
+    columns = [column for column in DIVIPOLA_FILL_COLUMNS if column in catalog]
+    lookup = catalog.drop_duplicates(subset=keys).set_index(keys)[columns]
+    matches = lookup.reindex(pd.MultiIndex.from_frame(frame[keys]))
+    matches.index = frame.index
+    return frame.assign(**frame[columns].combine_first(matches))
+
+
 def _prepare_divipola(raw: pd.DataFrame, source: Path) -> pd.DataFrame:
     columns = set(raw.columns)
     standard_columns = {"depto_cod", "depto", "muni_cod", "municipio", "lat", "lon"}
@@ -350,15 +630,18 @@ def _prepare_divipola(raw: pd.DataFrame, source: Path) -> pd.DataFrame:
             "MUNICIPIO",
         }
         if alt_required.issubset(columns):
-            depto_cod = raw["COD_DEPARTAMENTO"].astype("string").str.strip()
+            depto_cod = raw["COD_DEPARTAMENTO"].astype(_STRING_DTYPE).str.strip()
             if "COD_DANE" in raw.columns:
-                muni_cod = raw["COD_DANE"].astype("string").str.strip()
+                muni_cod = raw["COD_DANE"].astype(_STRING_DTYPE).str.strip()
             else:
                 dept_part = (
-                    raw["COD_DEPARTAMENTO"].astype("string").str.strip().str.zfill(2)
+                    raw["COD_DEPARTAMENTO"]
+                    .astype(_STRING_DTYPE)
+                    .str.strip()
+                    .str.zfill(2)
                 )
                 muni_part = (
-                    raw["COD_MUNICIPIO"].astype("string").str.strip().str.zfill(3)
+                    raw["COD_MUNICIPIO"].astype(_STRING_DTYPE).str.strip().str.zfill(3)
                 )
                 muni_cod = dept_part + muni_part
 
@@ -383,7 +666,7 @@ def _prepare_divipola(raw: pd.DataFrame, source: Path) -> pd.DataFrame:
         renamed = renamed[list(standard_columns)].copy()
 
     try:
-        geo = pd.read_excel(source, sheet_name="Hoja3", header=0, engine="openpyxl")
+        geo = _read_workbook(source, sheet_name="Hoja3", header=0)
         geo = geo.rename(
             columns={
                 "Departamento": "depto_cod",
@@ -396,26 +679,16 @@ def _prepare_divipola(raw: pd.DataFrame, source: Path) -> pd.DataFrame:
         )
         geo = geo.iloc[1:]
         for col in ["depto_cod", "muni_cod"]:
-            geo[col] = geo[col].astype("string").str.strip()
+            geo[col] = geo[col].astype(_STRING_DTYPE).str.strip()
         geo["depto_cod"] = geo["depto_cod"].str.zfill(2)
         geo["muni_cod"] = geo["muni_cod"].str.zfill(5)
-        geo["municipio"] = geo["municipio"].astype("string").str.strip()
-        geo["depto"] = geo["depto"].astype("string").str.strip()
-        geo_lon = geo["lon"].astype("string").str.replace(",", ".")
-        geo_lat = geo["lat"].astype("string").str.replace(",", ".")
+        geo["municipio"] = geo["municipio"].astype(_STRING_DTYPE).str.strip()
+        geo["depto"] = geo["depto"].astype(_STRING_DTYPE).str.strip()
+        geo_lon = geo["lon"].astype(_STRING_DTYPE).str.replace(",", ".")
+        geo_lat = geo["lat"].astype(_STRING_DTYPE).str.replace(",", ".")
         geo["lon"] = pd.to_numeric(geo_lon, errors="coerce")
         geo["lat"] = pd.to_numeric(geo_lat, errors="coerce")
-        renamed = renamed.merge(
-            geo,
-            on=["depto_cod", "muni_cod"],
-            how="left",
-            suffixes=("", "_geo"),
-        )
-        for column in ["depto", "municipio", "lat", "lon"]:
-            geo_column = f"{column}_geo"
-            if geo_column in renamed.columns:
-                renamed[column] = renamed[column].fillna(renamed[geo_column])
-                renamed = renamed.drop(columns=geo_column)
+        renamed = _fill_from_catalog(renamed, geo)
     except Exception:  # noqa: BLE001
         pass
 
@@ -434,30 +707,26 @@ def _prepare_divipola(raw: pd.DataFrame, source: Path) -> pd.DataFrame:
                 }
             )
             coords["depto_cod"] = (
-                coords["depto_cod"].astype("string").str.replace(r"\D", "", regex=True)
+                coords["depto_cod"]
+                .astype(_STRING_DTYPE)
+                .str.replace(r"\D", "", regex=True)
             )
             coords["depto_cod"] = coords["depto_cod"].str.zfill(2)
             coords["muni_cod"] = (
-                coords["muni_cod"].astype("string").str.replace(r"\D", "", regex=True)
+                coords["muni_cod"]
+                .astype(_STRING_DTYPE)
+                .str.replace(r"\D", "", regex=True)
             )
             coords["muni_cod"] = coords["muni_cod"].str.zfill(5)
-            coords["depto"] = coords["depto"].astype("string").str.strip().str.title()
+            coords["depto"] = (
+                coords["depto"].astype(_STRING_DTYPE).str.strip().str.title()
+            )
             coords["municipio"] = (
-                coords["municipio"].astype("string").str.strip().str.title()
+                coords["municipio"].astype(_STRING_DTYPE).str.strip().str.title()
             )
             coords["lat"] = pd.to_numeric(coords["lat"], errors="coerce")
             coords["lon"] = pd.to_numeric(coords["lon"], errors="coerce")
-            renamed = renamed.merge(
-                coords[["depto_cod", "muni_cod", "depto", "municipio", "lat", "lon"]],
-                on=["depto_cod", "muni_cod"],
-                how="left",
-                suffixes=("", "_catalog"),
-            )
-            for column in ["depto", "municipio", "lat", "lon"]:
-                catalog_column = f"{column}_catalog"
-                if catalog_column in renamed.columns:
-                    renamed[column] = renamed[column].fillna(renamed[catalog_column])
-                    renamed = renamed.drop(columns=catalog_column)
+            renamed = _fill_from_catalog(renamed, coords)
         except Exception:  # noqa: BLE001
             LOGGER.exception(
                 "No fue posible enriquecer coordenadas desde %s", csv_catalog
@@ -465,8 +734,10 @@ def _prepare_divipola(raw: pd.DataFrame, source: Path) -> pd.DataFrame:
 
     renamed["depto_cod"] = _normalize_code(renamed["depto_cod"], width=2)
     renamed["muni_cod"] = _normalize_code(renamed["muni_cod"], width=5)
-    renamed["depto"] = renamed["depto"].astype("string").str.strip().str.title()
-    renamed["municipio"] = renamed["municipio"].astype("string").str.strip().str.title()
+    renamed["depto"] = renamed["depto"].astype(_STRING_DTYPE).str.strip().str.title()
+    renamed["municipio"] = (
+        renamed["municipio"].astype(_STRING_DTYPE).str.strip().str.title()
+    )
     renamed["lat"] = pd.to_numeric(renamed["lat"], errors="coerce")
     renamed["lon"] = pd.to_numeric(renamed["lon"], errors="coerce")
     return renamed.drop_duplicates(subset=["depto_cod", "muni_cod"])
@@ -503,6 +774,52 @@ def _merge_datasets(
     ]
 
 
+def _optimize_dtypes(dataset: pd.DataFrame) -> pd.DataFrame:
+    """Store text dimensions as categoricals and small integers narrowly."""
+    dtypes: dict[str, str | pd.CategoricalDtype] = {
+        column: "category" for column in CATEGORICAL_COLUMNS
+    }
+    dtypes["grupo_edad_label"] = GRUPO_EDAD_DTYPE
+    dtypes.update(NARROW_INTEGER_COLUMNS)
+    return dataset.astype(dtypes)
+
+
+def _cluster_rows(dataset: pd.DataFrame) -> pd.DataFrame:
+    """Sort rows by geography and month so group keys sit in contiguous runs."""
+    return dataset.sort_values(
+        ["depto_cod", "muni_cod", "mes"], kind="stable", ignore_index=True
+    )
+
+
+def _validation_stamp(path: Path, frame: pd.DataFrame) -> str:
+    """Describe a validated Parquet file by its size, mtime and column dtypes."""
+    stat = path.stat()
+    return json.dumps(
+        {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "dtypes": frame.dtypes.astype(str).to_dict(),
+        },
+        sort_keys=True,
+    )
+
+
+def _stamp_path(path: Path) -> Path:
+    return path.with_name(path.name + VALIDATION_STAMP_SUFFIX)
+
+
+def _is_validated(path: Path, frame: pd.DataFrame) -> bool:
+    """Return True if ``frame`` was read from the file recorded by the stamp.
+
+    A matching stamp means the file is the one written after schema validation
+    and still has the validated columns and dtypes.
+    """
+    stamp = _stamp_path(path)
+    return stamp.exists() and stamp.read_text(encoding="utf-8") == (
+        _validation_stamp(path, frame)
+    )
+
+
 def _snapshot_settings() -> _SettingsSnapshot:
     settings = get_settings()
     return _SettingsSnapshot(
@@ -528,17 +845,31 @@ def load_data(force_refresh: bool = False) -> pd.DataFrame:
         and cache_path.stat().st_mtime >= _latest_modification(raw_paths)
     ):
         LOGGER.info("Cargando datos desde caché %s", cache_path)
-        cached_df = pd.read_parquet(cache_path, engine=get_parquet_engine())
-        return MORTALITY_SCHEMA.validate(cached_df)
-
-    records_raw = _read_excel(raw_dir, RAW_FILENAMES["records"])
-    causes_path = raw_dir / RAW_FILENAMES["causes"]
-    causes_raw = _read_excel(raw_dir, RAW_FILENAMES["causes"])
-    if all(str(col).startswith("Unnamed") for col in causes_raw.columns):
-        LOGGER.info("Releyendo catálogo de causas con encabezado en fila 9")
-        causes_raw = pd.read_excel(causes_path, engine="openpyxl", header=8)
+        cached_df = _read_parquet(cache_path)
+        if not _is_validated(cache_path, cached_df):
+            cached_df = MORTALITY_SCHEMA.validate(cached_df)
+        return _cluster_rows(_optimize_dtypes(cached_df))
+
+    # The workbooks are independent, so their file I/O and decompression, which
+    # release the GIL, can overlap instead of running back to back.
+    with ThreadPoolExecutor(max_workers=len(RAW_FILENAMES)) as executor:
+        records_future = executor.submit(
+            _read_excel,
+            raw_dir,
+            RAW_FILENAMES["records"],
+            _parse_records_workbook,
+            refresh=force_refresh,
+        )
+        causes_future = executor.submit(
+            _read_excel, raw_dir, RAW_FILENAMES["causes"], refresh=force_refresh
+        )
+        divipola_future = executor.submit(
+            _read_excel, raw_dir, RAW_FILENAMES["divipola"], refresh=force_refresh
+        )
+        records_raw = records_future.result()
+        causes_raw = causes_future.result()
+        divipola_raw = divipola_future.result()
     divipola_path = raw_dir / RAW_FILENAMES["divipola"]
-    divipola_raw = _read_excel(raw_dir, RAW_FILENAMES["divipola"])
 
     records = _prepare_records(records_raw)
     causes = _prepare_causes(causes_raw)
@@ -554,9 +885,27 @@ def load_data(force_refresh: bool = False) -> pd.DataFrame:
     validated = MORTALITY_SCHEMA.validate(dataset, lazy=True)
 
     LOGGER.info("Guardando datos procesados en %s", cache_path)
-    validated.to_parquet(cache_path, index=False, engine=get_parquet_engine())
-
-    return validated
-
-
-__all__ = ["load_data", "MORTALITY_SCHEMA", "GRUPO_EDAD_LABELS", "get_parquet_engine"]
+    _write_parquet(validated, cache_path)
+    try:
+        _stamp_path(cache_path).write_text(
+            _validation_stamp(cache_path, validated), encoding="utf-8"
+        )
+    except OSError as exc:
+        LOGGER.warning("No se pudo registrar la validación de %s: %s", cache_path, exc)
+
+    return _cluster_rows(_optimize_dtypes(validated))
+
+
+__all__ = [
+    "load_data",
+    "MORTALITY_SCHEMA",
+    "GRUPO_EDAD_LABELS",
+    "GRUPO_EDAD_DTYPE",
+    "MONTH_LABELS",
+    "CATEGORICAL_COLUMNS",
+    "NARROW_INTEGER_COLUMNS",
+    "get_excel_engine",
+    "get_parquet_engine",
+    "get_string_dtype",
+    "read_with_parquet_sidecar",
+]
@@ -2,497 +2,346 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+from html import escape
+
 from dash import Dash, dcc, html
+from dash.development.base_component import Component
+from flask import Response
+from plotly.io.json import to_json_plotly
 
 from .components import bars, hist, lines
 from .components import map as map_component
 from .components import pie, stacked, table
 
+_HEADER_META = (
+    "Fuente: Estadísticas Vitales 2019 (DANE)",
+    "Proyecto académico | Maestría IA 2025",
+    "Aplicaciones 1 | Orlando Duque",
+)
+_SEX_OPTIONS = (
+    {"label": "Todos", "value": "all"},
+    {"label": "Mujeres", "value": "F"},
+    {"label": "Hombres", "value": "M"},
+)
+_MONTH_MARKS = {month: {"label": str(month)} for month in range(1, 13)}
+
+ComponentId = str | dict[str, str]
+
+# The header is static text, so it ships in the HTML shell and paints with the
+# first response instead of waiting for the layout JSON and React.
+INDEX_STRING = """<!DOCTYPE html>
+<html>
+    <head>
+        {%metas%}
+        <title>{%title%}</title>
+        {%favicon%}
+        {%css%}
+    </head>
+    <body>
+        <div class="app-shell">
+            <header class="app-header" role="banner">
+                <div class="header-text">
+                    <h1 class="app-title" id="app-title">Mortalidad Colombia</h1>
+                    <p class="app-subtitle" id="app-subtitle">
+                        Análisis interactivo de mortalidad por territorio y causa.
+                    </p>
+                    <div class="header-meta">
+                        HEADER_META
+                    </div>
+                </div>
+            </header>
+            {%app_entry%}
+        </div>
+        <footer>
+            {%config%}
+            {%scripts%}
+            {%renderer%}
+        </footer>
+    </body>
+</html>
+""".replace(
+    "HEADER_META", "".join(f"<span>{escape(text)}</span>" for text in _HEADER_META)
+)
+
+
+def build_layout(_: Dash) -> html.Main:
+    """Return the accessible layout for the Dash application.
+
+    The tree is static, so it is built once and shared by every app instance.
+    """
+    return _layout()
+
+
+def _export_ids(card: str) -> tuple[ComponentId, ComponentId]:
+    """Return the pattern-matching export button and download ids of a card."""
+    return {"role": "export", "card": card}, {"role": "download", "card": card}
+
+
+def _viz_card(
+    kind: str,
+    title: str,
+    export_label: str,
+    export_ids: tuple[ComponentId, ComponentId],
+    content: Component,
+) -> html.Section:
+    """Return a chart card with its heading, CSV export button and content."""
+    button_id, download_id = export_ids
+    title_id = f"viz-{kind}-title"
+    return html.Section(
+        className=f"viz-card {kind}-card",
+        role="region",
+        **{"aria-labelledby": title_id},
+        children=[
+            html.Div(
+                className="card-header",
+                children=[
+                    html.H3(title, id=title_id),
+                    html.Button(
+                        "Exportar CSV",
+                        id=button_id,
+                        className="btn-export",
+                        type="button",
+                        **{"aria-label": export_label},
+                    ),
+                    dcc.Download(id=download_id),
+                ],
+            ),
+            dcc.Loading(className="loading-wrapper", type="circle", children=content),
+        ],
+    )
+
+
+def serve_static_layout(app: Dash) -> None:
+    """Answer ``/_dash-layout`` with the layout JSON encoded once.
+
+    Dash re-encodes the component tree on every page load; the tree never
+    changes after ``app.layout`` is assigned, so the bytes are reused, and apps
+    sharing the cached tree share its encoding too.
+    """
+    payload = _encode_layout(app.layout)
+
+    def serve_layout() -> Response:
+        return Response(payload, mimetype="application/json")
 
-def build_layout(_: Dash) -> html.Div:
-    """Generate the accessible layout for the Dash application."""
-    return html.Div(
-        className="app-shell",
+    endpoint = f"{app.config.routes_pathname_prefix}_dash-layout"
+    app.server.view_functions[endpoint] = serve_layout
+
+
+@lru_cache(maxsize=1)
+def _encode_layout(layout: Component) -> bytes:
+    payload: str = to_json_plotly(layout)
+    return payload.encode("utf-8")
+
+
+@lru_cache(maxsize=1)
+def _layout() -> html.Main:
+    return html.Main(
+        className="app-main",
+        role="main",
         children=[
-            html.Header(
-                className="app-header",
-                role="banner",
+            html.Section(
+                className="filters-section",
+                role="region",
+                **{"aria-labelledby": "filtros-titulo"},
                 children=[
                     html.Div(
-                        className="header-text",
+                        className="filters-header",
                         children=[
-                            html.H1(
-                                "Mortalidad Colombia",
-                                className="app-title",
-                                id="app-title",
-                            ),
+                            html.H2("Filtros", id="filtros-titulo"),
                             html.P(
                                 (
-                                    "Análisis interactivo de mortalidad por "
-                                    "territorio y causa."
+                                    "Refina los indicadores para comparar "
+                                    "territorios y causas."
                                 ),
-                                className="app-subtitle",
-                                id="app-subtitle",
-                            ),
-                            html.Div(
-                                className="header-meta",
-                                children=[
-                                    html.Span(
-                                        "Fuente: Estadísticas Vitales 2019 (DANE)"
-                                    ),
-                                    html.Span("Proyecto académico | Maestría IA 2025"),
-                                    html.Span("Aplicaciones 1 | Orlando Duque"),
-                                ],
+                                className="filters-description",
                             ),
                         ],
                     ),
-                ],
-            ),
-            html.Main(
-                className="app-main",
-                role="main",
-                children=[
-                    html.Section(
-                        className="filters-section",
-                        role="region",
-                        **{"aria-labelledby": "filtros-titulo"},
+                    html.Div(
+                        className="filters-grid",
                         children=[
                             html.Div(
-                                className="filters-header",
+                                className="filter-item",
                                 children=[
-                                    html.H2("Filtros", id="filtros-titulo"),
-                                    html.P(
-                                        (
-                                            "Refina los indicadores para comparar "
-                                            "territorios y causas."
-                                        ),
-                                        className="filters-description",
+                                    html.Label(
+                                        "Departamento",
+                                        className="filter-label",
+                                        htmlFor="filter-department",
+                                    ),
+                                    dcc.Dropdown(
+                                        id="filter-department",
+                                        options=[],
+                                        placeholder="Seleccione departamento",
+                                        multi=False,
+                                        clearable=True,
+                                        persistence=True,
+                                        persistence_type="session",
+                                        searchable=True,
                                     ),
                                 ],
                             ),
                             html.Div(
-                                className="filters-grid",
+                                className="filter-item",
                                 children=[
-                                    html.Div(
-                                        className="filter-item",
-                                        children=[
-                                            html.Label(
-                                                "Departamento",
-                                                className="filter-label",
-                                                htmlFor="filter-department",
-                                            ),
-                                            dcc.Dropdown(
-                                                id="filter-department",
-                                                options=[],
-                                                placeholder="Seleccione departamento",
-                                                multi=False,
-                                                clearable=True,
-                                                persistence=True,
-                                                persistence_type="session",
-                                                searchable=True,
-                                            ),
-                                        ],
+                                    html.Label(
+                                        "Municipio",
+                                        className="filter-label",
+                                        htmlFor="filter-municipality",
                                     ),
-                                    html.Div(
-                                        className="filter-item",
-                                        children=[
-                                            html.Label(
-                                                "Municipio",
-                                                className="filter-label",
-                                                htmlFor="filter-municipality",
-                                            ),
-                                            dcc.Dropdown(
-                                                id="filter-municipality",
-                                                options=[],
-                                                placeholder="Seleccione municipio",
-                                                multi=False,
-                                                clearable=True,
-                                                persistence=True,
-                                                persistence_type="session",
-                                                searchable=True,
-                                            ),
-                                        ],
-                                    ),
-                                    html.Div(
-                                        className="filter-item",
-                                        children=[
-                                            html.Label(
-                                                "Sexo",
-                                                className="filter-label",
-                                                htmlFor="filter-sex",
-                                            ),
-                                            dcc.RadioItems(
-                                                id="filter-sex",
-                                                options=[
-                                                    {"label": "Todos", "value": "all"},
-                                                    {"label": "Mujeres", "value": "F"},
-                                                    {"label": "Hombres", "value": "M"},
-                                                ],
-                                                value="all",
-                                                labelStyle={"display": "inline-flex"},
-                                                inputClassName="filter-radio",
-                                                persistence=True,
-                                                persistence_type="session",
-                                            ),
-                                        ],
-                                    ),
-                                    html.Div(
-                                        className="filter-item",
-                                        children=[
-                                            html.Label(
-                                                "Causa específica",
-                                                className="filter-label",
-                                                htmlFor="filter-homicide",
-                                            ),
-                                            dcc.Checklist(
-                                                id="filter-homicide",
-                                                options=[
-                                                    {
-                                                        "label": (
-                                                            "Mostrar solo homicidios "
-                                                            "con arma de fuego (X95)"
-                                                        ),
-                                                        "value": "x95",
-                                                    }
-                                                ],
-                                                value=[],
-                                                inputClassName="filter-checkbox",
-                                                persistence=True,
-                                                persistence_type="session",
-                                            ),
-                                        ],
-                                    ),
-                                    html.Div(
-                                        className="filter-item filter-slider",
-                                        children=[
-                                            html.Label(
-                                                "Meses",
-                                                className="filter-label",
-                                                htmlFor="filter-months",
-                                            ),
-                                            dcc.RangeSlider(
-                                                id="filter-months",
-                                                min=1,
-                                                max=12,
-                                                step=1,
-                                                value=[1, 12],
-                                                marks={
-                                                    month: {"label": str(month)}
-                                                    for month in range(1, 13)
-                                                },
-                                                allowCross=False,
-                                                persistence=True,
-                                                persistence_type="session",
-                                                updatemode="mouseup",
-                                            ),
-                                        ],
+                                    dcc.Dropdown(
+                                        id="filter-municipality",
+                                        options=[],
+                                        placeholder="Seleccione municipio",
+                                        multi=False,
+                                        clearable=True,
+                                        persistence=True,
+                                        persistence_type="session",
+                                        searchable=True,
                                     ),
                                 ],
                             ),
-                        ],
-                    ),
-                    html.Section(
-                        className="viz-section",
-                        role="region",
-                        **{"aria-label": "Visualizaciones de mortalidad"},
-                        children=[
                             html.Div(
-                                className="viz-grid",
+                                className="filter-item",
                                 children=[
-                                    html.Section(
-                                        className="viz-card map-card",
-                                        role="region",
-                                        **{"aria-labelledby": "viz-map-title"},
-                                        children=[
-                                            html.Div(
-                                                className="card-header",
-                                                children=[
-                                                    html.H3(
-                                                        (
-                                                            "Mapa de mortalidad por "
-                                                            "departamento"
-                                                        ),
-                                                        id="viz-map-title",
-                                                    ),
-                                                    html.Button(
-                                                        "Exportar CSV",
-                                                        id="export-map",
-                                                        className="btn-export",
-                                                        type="button",
-                                                        **{
-                                                            "aria-label": (
-                                                                "Descargar datos del "
-                                                                "mapa"
-                                                            ),
-                                                        },
-                                                    ),
-                                                    dcc.Download(id="download-map"),
-                                                ],
-                                            ),
-                                            dcc.Loading(
-                                                className="loading-wrapper",
-                                                type="circle",
-                                                children=map_component.render(
-                                                    title=(
-                                                        "Mapa coroplético por "
-                                                        "departamento"
-                                                    )
-                                                ),
-                                            ),
-                                        ],
+                                    html.Label(
+                                        "Sexo",
+                                        className="filter-label",
+                                        htmlFor="filter-sex",
                                     ),
-                                    html.Section(
-                                        className="viz-card line-card",
-                                        role="region",
-                                        **{"aria-labelledby": "viz-line-title"},
-                                        children=[
-                                            html.Div(
-                                                className="card-header",
-                                                children=[
-                                                    html.H3(
-                                                        (
-                                                            "Tendencia mensual de "
-                                                            "muertes"
-                                                        ),
-                                                        id="viz-line-title",
-                                                    ),
-                                                    html.Button(
-                                                        "Exportar CSV",
-                                                        id="export-lines",
-                                                        className="btn-export",
-                                                        type="button",
-                                                        **{
-                                                            "aria-label": (
-                                                                "Descargar serie "
-                                                                "mensual"
-                                                            ),
-                                                        },
-                                                    ),
-                                                    dcc.Download(id="download-lines"),
-                                                ],
-                                            ),
-                                            dcc.Loading(
-                                                className="loading-wrapper",
-                                                type="circle",
-                                                children=lines.render(
-                                                    title="Muertes por mes",
-                                                ),
-                                            ),
-                                        ],
+                                    dcc.RadioItems(
+                                        id="filter-sex",
+                                        options=list(_SEX_OPTIONS),
+                                        value="all",
+                                        labelStyle={"display": "inline-flex"},
+                                        inputClassName="filter-radio",
+                                        persistence=True,
+                                        persistence_type="session",
                                     ),
-                                    html.Section(
-                                        className="viz-card bars-card",
-                                        role="region",
-                                        **{"aria-labelledby": "viz-bars-title"},
-                                        children=[
-                                            html.Div(
-                                                className="card-header",
-                                                children=[
-                                                    html.H3(
-                                                        (
-                                                            "Top 5 ciudades con más "
-                                                            "homicidios (X95)"
-                                                        ),
-                                                        id="viz-bars-title",
-                                                    ),
-                                                    html.Button(
-                                                        "Exportar CSV",
-                                                        id="export-bars",
-                                                        className="btn-export",
-                                                        type="button",
-                                                        **{
-                                                            "aria-label": (
-                                                                "Descargar ranking de "
-                                                                "homicidios"
-                                                            ),
-                                                        },
-                                                    ),
-                                                    dcc.Download(id="download-bars"),
-                                                ],
-                                            ),
-                                            dcc.Loading(
-                                                className="loading-wrapper",
-                                                type="circle",
-                                                children=bars.render(
-                                                    title=(
-                                                        "Top 5 ciudades con más "
-                                                        "homicidios (X95)"
-                                                    ),
-                                                ),
-                                            ),
-                                        ],
+                                ],
+                            ),
+                            html.Div(
+                                className="filter-item",
+                                children=[
+                                    html.Label(
+                                        "Causa específica",
+                                        className="filter-label",
+                                        htmlFor="filter-homicide",
                                     ),
-                                    html.Section(
-                                        className="viz-card pie-card",
-                                        role="region",
-                                        **{"aria-labelledby": "viz-pie-title"},
-                                        children=[
-                                            html.Div(
-                                                className="card-header",
-                                                children=[
-                                                    html.H3(
-                                                        (
-                                                            "Ciudades con menor "
-                                                            "mortalidad (top 10)"
-                                                        ),
-                                                        id="viz-pie-title",
-                                                    ),
-                                                    html.Button(
-                                                        "Exportar CSV",
-                                                        id="export-pie",
-                                                        className="btn-export",
-                                                        type="button",
-                                                        **{
-                                                            "aria-label": (
-                                                                "Descargar ranking de "
-                                                                "menor mortalidad"
-                                                            ),
-                                                        },
-                                                    ),
-                                                    dcc.Download(id="download-pie"),
-                                                ],
-                                            ),
-                                            dcc.Loading(
-                                                className="loading-wrapper",
-                                                type="circle",
-                                                children=pie.render(
-                                                    title=(
-                                                        "10 ciudades con menor "
-                                                        "mortalidad"
-                                                    ),
+                                    dcc.Checklist(
+                                        id="filter-homicide",
+                                        options=[
+                                            {
+                                                "label": (
+                                                    "Mostrar solo homicidios "
+                                                    "con arma de fuego (X95)"
                                                 ),
-                                            ),
-                                        ],
-                                    ),
-                                    html.Section(
-                                        className="viz-card table-card",
-                                        role="region",
-                                        **{"aria-labelledby": "viz-table-title"},
-                                        children=[
-                                            html.Div(
-                                                className="card-header",
-                                                children=[
-                                                    html.H3(
-                                                        (
-                                                            "Principales causas de "
-                                                            "muerte"
-                                                        ),
-                                                        id="viz-table-title",
-                                                    ),
-                                                    html.Button(
-                                                        "Exportar CSV",
-                                                        id="export-table",
-                                                        className="btn-export",
-                                                        type="button",
-                                                        **{
-                                                            "aria-label": (
-                                                                "Descargar top de "
-                                                                "causas"
-                                                            ),
-                                                        },
-                                                    ),
-                                                    dcc.Download(id="download-table"),
-                                                ],
-                                            ),
-                                            dcc.Loading(
-                                                className="loading-wrapper",
-                                                type="circle",
-                                                children=table.render(),
-                                            ),
+                                                "value": "x95",
+                                            }
                                         ],
+                                        value=[],
+                                        inputClassName="filter-checkbox",
+                                        persistence=True,
+                                        persistence_type="session",
                                     ),
-                                    html.Section(
-                                        className="viz-card stacked-card",
-                                        role="region",
-                                        **{"aria-labelledby": "viz-stacked-title"},
-                                        children=[
-                                            html.Div(
-                                                className="card-header",
-                                                children=[
-                                                    html.H3(
-                                                        (
-                                                            "Muertes por sexo y "
-                                                            "departamento"
-                                                        ),
-                                                        id="viz-stacked-title",
-                                                    ),
-                                                    html.Button(
-                                                        "Exportar CSV",
-                                                        id="export-stacked",
-                                                        className="btn-export",
-                                                        type="button",
-                                                        **{
-                                                            "aria-label": (
-                                                                "Descargar datos sexo "
-                                                                "por departamento"
-                                                            ),
-                                                        },
-                                                    ),
-                                                    dcc.Download(id="download-stacked"),
-                                                ],
-                                            ),
-                                            dcc.Loading(
-                                                className="loading-wrapper",
-                                                type="circle",
-                                                children=stacked.render(
-                                                    title=(
-                                                        "Muertes por sexo y "
-                                                        "departamento"
-                                                    )
-                                                ),
-                                            ),
-                                        ],
+                                ],
+                            ),
+                            html.Div(
+                                className="filter-item filter-slider",
+                                children=[
+                                    html.Label(
+                                        "Meses",
+                                        className="filter-label",
+                                        htmlFor="filter-months",
                                     ),
-                                    html.Section(
-                                        className="viz-card hist-card",
-                                        role="region",
-                                        **{"aria-labelledby": "viz-hist-title"},
-                                        children=[
-                                            html.Div(
-                                                className="card-header",
-                                                children=[
-                                                    html.H3(
-                                                        (
-                                                            "Distribución por "
-                                                            "grupo de edad"
-                                                        ),
-                                                        id="viz-hist-title",
-                                                    ),
-                                                    html.Button(
-                                                        "Exportar CSV",
-                                                        id="export-hist",
-                                                        className="btn-export",
-                                                        type="button",
-                                                        **{
-                                                            "aria-label": (
-                                                                "Descargar "
-                                                                "distribución por edad"
-                                                            ),
-                                                        },
-                                                    ),
-                                                    dcc.Download(id="download-hist"),
-                                                ],
-                                            ),
-                                            dcc.Loading(
-                                                className="loading-wrapper",
-                                                type="circle",
-                                                children=hist.render(
-                                                    title=(
-                                                        "Distribución por "
-                                                        "grupo de edad"
-                                                    )
-                                                ),
-                                            ),
-                                        ],
+                                    dcc.RangeSlider(
+                                        id="filter-months",
+                                        min=1,
+                                        max=12,
+                                        step=1,
+                                        value=[1, 12],
+                                        marks=_MONTH_MARKS,
+                                        allowCross=False,
+                                        persistence=True,
+                                        persistence_type="session",
+                                        updatemode="mouseup",
                                     ),
                                 ],
                             ),
                         ],
                     ),
+                    dcc.Store(id="filter-batch", storage_type="memory"),
+                ],
+            ),
+            html.Section(
+                className="viz-section",
+                role="region",
+                **{"aria-label": "Visualizaciones de mortalidad"},
+                children=[
+                    html.Div(
+                        className="viz-grid",
+                        children=[
+                            _viz_card(
+                                "map",
+                                "Mapa de mortalidad por departamento",
+                                "Descargar datos del mapa",
+                                _export_ids("map"),
+                                map_component.render(
+                                    title="Mapa coroplético por departamento"
+                                ),
+                            ),
+                            _viz_card(
+                                "line",
+                                "Tendencia mensual de muertes",
+                                "Descargar serie mensual",
+                                _export_ids("lines"),
+                                lines.render(title="Muertes por mes"),
+                            ),
+                            _viz_card(
+                                "bars",
+                                "Top 5 ciudades con más homicidios (X95)",
+                                "Descargar ranking de homicidios",
+                                _export_ids("bars"),
+                                bars.render(
+                                    title=("Top 5 ciudades con más " "homicidios (X95)")
+                                ),
+                            ),
+                            _viz_card(
+                                "pie",
+                                "Ciudades con menor mortalidad (top 10)",
+                                "Descargar ranking de menor mortalidad",
+                                _export_ids("pie"),
+                                pie.render(title="10 ciudades con menor mortalidad"),
+                            ),
+                            # The table CSV is written clientside, so its
+                            # ids stay out of the export pattern.
+                            _viz_card(
+                                "table",
+                                "Principales causas de muerte",
+                                "Descargar top de causas",
+                                ("export-table", "download-table"),
+                                table.render(),
+                            ),
+                            _viz_card(
+                                "stacked",
+                                "Muertes por sexo y departamento",
+                                "Descargar datos sexo por departamento",
+                                _export_ids("stacked"),
+                                stacked.render(title="Muertes por sexo y departamento"),
+                            ),
+                            _viz_card(
+                                "hist",
+                                "Distribución por grupo de edad",
+                                "Descargar distribución por edad",
+                                _export_ids("hist"),
+                                hist.render(title="Distribución por grupo de edad"),
+                            ),
+                        ],
+                    ),
                 ],
             ),
         ],
     )
 
 
-__all__ = ["build_layout"]
+__all__ = ["INDEX_STRING", "build_layout", "serve_static_layout"]
@@ -4,18 +4,83 @@ from __future__ import annotations
 
 import json
 import logging
+import time
+from collections.abc import Callable
+from functools import lru_cache
 from logging import config as logging_config
-from typing import Any
-
-from dash import Dash
+from typing import TYPE_CHECKING, Any
 
 from .config import get_settings
 
+if TYPE_CHECKING:
+    from dash import Dash
+    from flask import Response
+
+LOGGER = logging.getLogger(__name__)
+
+_ERROR_HTML = (
+    '<div style="padding:2rem;font-family:Inter,sans-serif;">'
+    "<h1>Algo salió mal</h1>"
+    "<p>Ocurrió un error inesperado. Intenta recargar la página o "
+    "contáctanos si persiste.</p>"
+    "</div>"
+).encode()
+
+
+@lru_cache(maxsize=1)
+def _json_encoder() -> Callable[[dict[str, Any]], bytes]:
+    """Return orjson's UTF-8 encoder when it is installed, else the stdlib one."""
+    try:
+        import orjson
+    except ImportError:
+
+        def encode(payload: dict[str, Any]) -> bytes:
+            return json.dumps(payload, ensure_ascii=False).encode()
+
+        return encode
+
+    def dumps(payload: dict[str, Any]) -> bytes:
+        encoded: bytes = orjson.dumps(payload)
+        return encoded
+
+    return dumps
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """Formatter that renders each wall-clock second's timestamp only once."""
+
+    _last_second: tuple[int, str] = (-1, "")
 
-class JsonFormatter(logging.Formatter):
+    def formatTime(  # noqa: N802
+        self, record: logging.LogRecord, datefmt: str | None = None
+    ) -> str:
+        """Format the record time, reusing the rendering of the current second.
+
+        Bursts of records share a wall-clock second, so ``strftime`` only runs
+        when the second changes.
+        """
+        if datefmt != self.datefmt:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        cached_second, formatted = self._last_second
+        if second != cached_second:
+            formatted = time.strftime(
+                self.datefmt or self.default_time_format, self.converter(second)
+            )
+            self._last_second = (second, formatted)
+        if self.datefmt or not self.default_msec_format:
+            return formatted
+        return self.default_msec_format % (formatted, record.msecs)
+
+
+class JsonFormatter(CachedTimeFormatter):
     """Serialize log records as JSON strings for production environments."""
 
     def format(self, record: logging.LogRecord) -> str:
+        return self.format_bytes(record).decode()
+
+    def format_bytes(self, record: logging.LogRecord) -> bytes:
+        """Return the JSON document for ``record`` encoded as UTF-8."""
         payload = {
             "level": record.levelname,
             "logger": record.name,
@@ -23,8 +88,39 @@ class JsonFormatter(logging.Formatter):
             "time": self.formatTime(record, self.datefmt),
         }
         if record.exc_info:
-            payload["exc_info"] = self.formatException(record.exc_info)
-        return json.dumps(payload, ensure_ascii=False)
+            # Cache the traceback on the record like logging.Formatter.format, so
+            # every handler after the first reuses it.
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+            payload["exc_info"] = record.exc_text
+        return _json_encoder()(payload)
+
+
+class BytesStreamHandler(logging.StreamHandler):  # type: ignore[type-arg]
+    """Stream handler writing UTF-8 lines straight to the stream's byte buffer.
+
+    JSON records are encoded once by the formatter instead of again by the text
+    wrapper. Streams without a ``buffer`` (e.g. captured output) are written as
+    text.
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        buffer = getattr(self.stream, "buffer", None)
+        if buffer is None:
+            super().emit(record)
+            return
+        try:
+            formatter = self.formatter
+            if isinstance(formatter, JsonFormatter):
+                line = formatter.format_bytes(record)
+            else:
+                line = self.format(record).encode()
+            buffer.write(line + b"\n")
+            self.flush()
+        except RecursionError:
+            raise
+        except Exception:  # noqa: BLE001
+            self.handleError(record)
 
 
 def _development_config() -> dict[str, Any]:
@@ -34,7 +130,8 @@ def _development_config() -> dict[str, Any]:
         "disable_existing_loggers": False,
         "formatters": {
             "console": {
-                "format": "%(asctime)s | %(levelname)s | %(name)s | %(message)s",
+                "()": CachedTimeFormatter,
+                "fmt": "%(asctime)s | %(levelname)s | %(name)s | %(message)s",
                 "datefmt": "%Y-%m-%d %H:%M:%S",
             }
         },
@@ -62,7 +159,7 @@ def _production_config() -> dict[str, Any]:
         },
         "handlers": {
             "json": {
-                "class": "logging.StreamHandler",
+                "()": BytesStreamHandler,
                 "formatter": "json",
                 "level": "INFO",
             }
@@ -71,28 +168,37 @@ def _production_config() -> dict[str, Any]:
     }
 
 
-def configure_logging() -> None:
-    """Configure logging based on the current environment."""
-    settings = get_settings()
-    config = _production_config() if settings.is_production else _development_config()
+@lru_cache(maxsize=1)
+def _apply_config(is_production: bool) -> None:
+    """Install the logging configuration for one environment profile."""
+    config = _production_config() if is_production else _development_config()
     logging_config.dictConfig(config)
 
 
+def configure_logging() -> None:
+    """Configure logging based on the current environment.
+
+    Repeated calls for the same environment leave the handlers in place.
+    """
+    _apply_config(get_settings().is_production)
+
+
 def register_exception_handlers(app: Dash) -> None:
     """Attach exception handlers to the underlying Flask application."""
+    from flask import Response
+
     server = app.server
 
     @server.errorhandler(Exception)  # type: ignore[misc]
-    def handle_exception(error: Exception) -> tuple[str, int]:
-        logging.exception("Unhandled exception", exc_info=error)
-        message = (
-            '<div style="padding:2rem;font-family:Inter,sans-serif;">'
-            "<h1>Algo salió mal</h1>"
-            "<p>Ocurrió un error inesperado. Intenta recargar la página o "
-            "contáctanos si persiste.</p>"
-            "</div>"
-        )
-        return message, 500
-
-
-__all__ = ["configure_logging", "register_exception_handlers", "JsonFormatter"]
+    def handle_exception(error: Exception) -> Response:
+        LOGGER.exception("Unhandled exception", exc_info=error)
+        return Response(_ERROR_HTML, status=500, mimetype="text/html")
+
+
+__all__ = [
+    "configure_logging",
+    "register_exception_handlers",
+    "BytesStreamHandler",
+    "CachedTimeFormatter",
+    "JsonFormatter",
+]
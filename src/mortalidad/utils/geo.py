@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from functools import lru_cache
 from pathlib import Path
 
 import pandas as pd
@@ -18,11 +19,33 @@ def normalize_department_code(code: str) -> str:
     return cleaned.zfill(2)
 
 
+def normalize_department_codes(codes: pd.Series) -> pd.Series:
+    """Vectorized :func:`normalize_department_code` for a whole column."""
+    cleaned = codes.astype("string").str.strip()
+    valid = cleaned.str.fullmatch(r"\d+").fillna(False).astype(bool)
+    if not valid.all():
+        invalid = codes[~valid].unique().tolist()
+        raise ValueError(f"Los códigos {invalid} deben contener solo dígitos.")
+    return cleaned.str.zfill(2)
+
+
+@lru_cache(maxsize=1)
+def _load_divipola_cached(
+    path_str: str, mtime_ns: int, reader: Callable[[Path], pd.DataFrame]
+) -> pd.DataFrame:
+    """Read the catalog once per file version and reader."""
+    return reader(Path(path_str))
+
+
 def load_divipola(
     reader: Callable[[Path], pd.DataFrame] | None = None,
     path: Path | None = None,
 ) -> pd.DataFrame:
-    """Load the Divipola catalog for spatial joins."""
+    """Load the Divipola catalog for spatial joins.
+
+    The frame returned by ``reader`` is memoized for the file version and the
+    reader, and a copy is returned so callers may mutate it.
+    """
     settings = get_settings()
     catalog_path = path or settings.data_dir / "Divipola.xlsx"
     if reader is None:
@@ -30,7 +53,9 @@ def load_divipola(
             "Proporciona una función lectora (por ejemplo, "
             "pandas.read_excel) como argumento."
         )
-    return reader(catalog_path)
+    return _load_divipola_cached(
+        str(catalog_path), catalog_path.stat().st_mtime_ns, reader
+    ).copy()
 
 
-__all__ = ["normalize_department_code", "load_divipola"]
+__all__ = ["normalize_department_code", "normalize_department_codes", "load_divipola"]
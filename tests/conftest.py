@@ -0,0 +1,85 @@
+"""Shared fixtures for the test suite."""
+
+from __future__ import annotations
+
+import pandas as pd
+import pytest
+from dash import Dash
+from flask.testing import FlaskClient
+
+from mortalidad.app import create_app
+from mortalidad.callbacks import _freeze_dataframe
+
+_SAMPLE_RECORDS = {
+    "depto_cod": ["11", "11", "05", "05", "76"],
+    "depto": ["Bogotá", "Bogotá", "Antioquia", "Antioquia", "Valle"],
+    "muni_cod": ["11001", "11001", "05001", "05001", "76001"],
+    "municipio": ["Bogotá D.C.", "Bogotá D.C.", "Medellín", "Medellín", "Cali"],
+    "sexo": ["M", "F", "M", "F", "M"],
+    "grupo_edad": [5, 6, 7, 5, 6],
+    "grupo_edad_label": [
+        "15 a 19 años",
+        "20 a 24 años",
+        "25 a 34 años",
+        "15 a 19 años",
+        "20 a 24 años",
+    ],
+    "fecha": pd.to_datetime(
+        ["2019-05-10", "2019-06-11", "2019-07-09", "2019-07-10", "2019-08-01"]
+    ),
+    "anio": [2019, 2019, 2019, 2019, 2019],
+    "mes": [5, 6, 7, 7, 8],
+    "causa_cod": ["X95", "A10", "X95", "B20", "X95"],
+    "causa": [
+        "Agresión con arma de fuego (homicidio)",
+        "Enfermedades infecciosas",
+        "Agresión con arma de fuego (homicidio)",
+        "Enfermedades virales",
+        "Agresión con arma de fuego (homicidio)",
+    ],
+    "homicidio_x95": [1, 0, 1, 0, 1],
+    "lat": [4.711, 4.711, 6.244, 6.244, 3.451],
+    "lon": [-74.072, -74.072, -75.581, -75.581, -76.532],
+}
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--run-browser",
+        action="store_true",
+        default=False,
+        help="Run the Selenium tests marked with 'browser'.",
+    )
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    """Skip browser tests unless ``--run-browser`` is given."""
+    if config.getoption("--run-browser"):
+        return
+    skip = pytest.mark.skip(reason="needs --run-browser")
+    for item in items:
+        if "browser" in item.keywords:
+            item.add_marker(skip)
+
+
+@pytest.fixture(scope="session")
+def app_instance() -> Dash:
+    """Build the Dash application once for every test that needs it."""
+    return create_app()
+
+
+@pytest.fixture(scope="session")
+def flask_client(app_instance: Dash) -> FlaskClient:
+    """Return a test client bound to the shared application."""
+    return app_instance.server.test_client()
+
+
+@pytest.fixture(scope="session")
+def sample_df() -> pd.DataFrame:
+    """Return a read-only synthetic dataset emulating the processed frame.
+
+    The frame is built once; tests that need to write must take a copy.
+    """
+    return _freeze_dataframe(pd.DataFrame(_SAMPLE_RECORDS))
@@ -1,19 +1,44 @@
 """Smoke tests for the Dash application."""
 
-from dash import Dash
+from dash import Dash, dcc
+from flask.testing import FlaskClient
+from plotly.io.json import to_json_plotly
 
-from mortalidad.app import app, create_app
 
-
-def test_create_app_returns_dash_instance() -> None:
+def test_create_app_returns_dash_instance(app_instance: Dash) -> None:
     """Ensure the factory creates a Dash app."""
-    test_app = create_app()
-    assert isinstance(test_app, Dash)
-    assert test_app.server is not None
+    assert isinstance(app_instance, Dash)
+    assert app_instance.server is not None
 
 
-def test_index_returns_success() -> None:
+def test_index_returns_success(flask_client: FlaskClient) -> None:
     """Ensure the root endpoint is reachable."""
-    client = app.server.test_client()
-    response = client.get("/")
+    response = flask_client.get("/")
     assert response.status_code == 200
+
+
+def test_layout_route_serves_the_encoded_layout(
+    app_instance: Dash, flask_client: FlaskClient
+) -> None:
+    """The pre-encoded layout must match what Dash would serialize itself."""
+    response = flask_client.get("/_dash-layout")
+    assert response.mimetype == "application/json"
+    assert response.get_data(as_text=True) == to_json_plotly(app_instance.layout)
+
+
+def test_header_is_served_in_the_html_shell(flask_client: FlaskClient) -> None:
+    """The static header must arrive with the index page, not the layout JSON."""
+    index = flask_client.get("/").get_data(as_text=True)
+    assert '<h1 class="app-title" id="app-title">Mortalidad Colombia</h1>' in index
+    assert "app-title" not in flask_client.get("/_dash-layout").get_data(as_text=True)
+
+
+def test_chart_cards_show_a_loading_indicator(app_instance: Dash) -> None:
+    """Every chart card must wrap its content in ``dcc.Loading``."""
+    cards = [
+        component
+        for component in app_instance.layout._traverse()
+        if "viz-card" in (getattr(component, "className", None) or "")
+    ]
+    assert len(cards) == 7
+    assert all(isinstance(card.children[-1], dcc.Loading) for card in cards)
@@ -2,51 +2,17 @@
 
 from __future__ import annotations
 
+import base64
+import copy
+import json
 import shutil
 
 import pandas as pd
 import pytest
+from dash import Dash
 
 from mortalidad import callbacks
-from mortalidad.app import create_app
-
-
-@pytest.fixture()
-def sample_df() -> pd.DataFrame:
-    """Return a synthetic dataset for callback tests."""
-    return pd.DataFrame(
-        {
-            "depto_cod": ["11", "11", "05", "05", "76"],
-            "depto": ["Bogotá", "Bogotá", "Antioquia", "Antioquia", "Valle"],
-            "muni_cod": ["11001", "11001", "05001", "05001", "76001"],
-            "municipio": ["Bogotá D.C.", "Bogotá D.C.", "Medellín", "Medellín", "Cali"],
-            "sexo": ["M", "F", "M", "F", "M"],
-            "grupo_edad": [5, 6, 7, 5, 6],
-            "grupo_edad_label": [
-                "15 a 19 años",
-                "20 a 24 años",
-                "25 a 34 años",
-                "15 a 19 años",
-                "20 a 24 años",
-            ],
-            "fecha": pd.to_datetime(
-                ["2019-05-10", "2019-06-11", "2019-07-09", "2019-07-10", "2019-08-01"]
-            ),
-            "anio": [2019, 2019, 2019, 2019, 2019],
-            "mes": [5, 6, 7, 7, 8],
-            "causa_cod": ["X95", "A10", "X95", "B20", "X95"],
-            "causa": [
-                "Agresión con arma de fuego (homicidio)",
-                "Enfermedades infecciosas",
-                "Agresión con arma de fuego (homicidio)",
-                "Enfermedades virales",
-                "Agresión con arma de fuego (homicidio)",
-            ],
-            "homicidio_x95": [1, 0, 1, 0, 1],
-            "lat": [4.711, 4.711, 6.244, 6.244, 3.451],
-            "lon": [-74.072, -74.072, -75.581, -75.581, -76.532],
-        }
-    )
+from mortalidad.components import bars, hist, lines, pie, stacked
 
 
 @pytest.fixture(autouse=True)
@@ -55,7 +21,21 @@ def patch_base_dataframe(
 ) -> None:
     """Patch data access to use the synthetic dataset."""
     callbacks._CACHE = type(callbacks._CACHE)(default_timeout=callbacks.CACHE_TIMEOUT)
-    monkeypatch.setattr(callbacks, "_get_base_dataframe", lambda: sample_df.copy())
+    callbacks._AGG_CACHE = type(callbacks._AGG_CACHE)(
+        default_timeout=callbacks.CACHE_TIMEOUT
+    )
+    callbacks._FIG_CACHE = type(callbacks._FIG_CACHE)(
+        default_timeout=callbacks.CACHE_TIMEOUT
+    )
+    monkeypatch.setattr(callbacks, "_get_base_dataframe", lambda: sample_df)
+    callbacks._clear_caches()
+
+
+def test_municipality_options_are_memoized_per_department() -> None:
+    """Option lists must be built once per department and scoped to it."""
+    options = callbacks._municipality_options("05")
+    assert [option["value"] for option in options] == ["all", "05001"]
+    assert callbacks._municipality_options("05") is options
 
 
 def test_get_filters_state_homicides_only(sample_df: pd.DataFrame) -> None:
@@ -71,13 +51,235 @@ def test_get_filters_state_homicides_only(sample_df: pd.DataFrame) -> None:
     assert len(result) == sample_df[sample_df["homicidio_x95"] == 1].shape[0]
 
 
+def test_get_filters_state_combines_predicates() -> None:
+    """All active filters must be applied together in a single selection."""
+    result = callbacks.get_filters_state(
+        department_value="05",
+        municipality_value="all",
+        sex_value="f",
+        homicide_values=[],
+        month_values=[7, 7],
+    )
+    assert result.index.tolist() == [0]
+    assert result.loc[0, "causa_cod"] == "B20"
+
+
+def test_export_frames_are_memoized_per_filter_state() -> None:
+    """Export aggregations must be computed once per filter combination."""
+    selection = callbacks._resolve_filters("05", None, "all", [], [1, 12])
+    exported = callbacks._cached_export(selection, "map")
+    assert exported["total"].tolist() == [2]
+
+    cached = callbacks._AGG_CACHE.get(f"{selection.cache_key}::map")
+    assert cached is not None
+    pd.testing.assert_frame_equal(cached, exported)
+
+
+def test_stacked_export_labels_sexes_in_display_order(
+    sample_df: pd.DataFrame,
+) -> None:
+    """Sex codes must be renamed to ordered display labels in the export."""
+    exported = callbacks._stacked_export(sample_df.astype({"sexo": "category"}))
+    assert exported["sexo"].cat.categories.tolist() == ["Mujeres", "Hombres"]
+    assert exported["sexo"].cat.ordered
+    assert exported.loc[exported["depto"] == "Antioquia", "sexo"].tolist() == [
+        "Mujeres",
+        "Hombres",
+    ]
+
+
+def test_pie_matches_low_mortality_export_on_ties() -> None:
+    """Tied totals must be broken by municipality code in figure and export."""
+    df = pd.DataFrame(
+        {
+            "muni_cod": ["76001", "76001", "11001", "05001", "08001"],
+            "municipio": ["Cali", "Cali", "Bogotá D.C.", "Medellín", "Barranquilla"],
+            "causa_cod": ["X95", "A10", "X95", "B20", "X95"],
+        }
+    )
+    counts = callbacks._count_by(df, "muni_cod", ["municipio"]).iloc[::-1]
+    figure = pie.build_lowest_mortality_pie(df, counts=counts)
+    exported = callbacks._low_mortality_export(df)
+    assert list(figure.data[0].labels) == exported["municipio"].tolist()
+    assert exported["muni_cod"].tolist() == ["05001", "08001", "11001", "76001"]
+
+
+def test_bars_match_homicide_export_on_ties() -> None:
+    """Tied homicide totals must be broken by municipality code in both."""
+    df = pd.DataFrame(
+        {
+            "muni_cod": ["05001", "08001", "11001", "13001", "17001", "76001"],
+            "municipio": [
+                "Medellín",
+                "Barranquilla",
+                "Bogotá D.C.",
+                "Cartagena",
+                "Manizales",
+                "Cali",
+            ],
+            "depto": ["Antioquia", "Atlántico", "Bogotá", "Bolívar", "Caldas"]
+            + ["Valle"],
+            "causa_cod": ["X95"] * 6,
+            "homicidio_x95": [1] * 6,
+        }
+    )
+    figure = bars.build_top_homicide_bars(df)
+    exported = callbacks._homicide_export(df)
+    assert list(figure.data[0].x) == exported["municipio"].tolist()
+    assert exported["muni_cod"].tolist() == [
+        "05001",
+        "08001",
+        "11001",
+        "13001",
+        "17001",
+    ]
+
+
+def test_table_export_is_written_clientside(app_instance: Dash) -> None:
+    """The table CSV must be built in the browser from the rendered rows."""
+    exports = {
+        callback["output"]: callback
+        for callback in app_instance._callback_list
+        if "download" in callback["output"]
+    }
+    table_export = exports["download-table.data"]
+    assert table_export["clientside_function"] is not None
+    assert table_export["state"] == [{"id": "mortality-table", "property": "data"}]
+    figure_export = exports['{"card":["MATCH"],"role":"download"}.data']
+    assert not figure_export.get("clientside_function")
+
+
+def test_figures_refresh_from_the_debounced_filter_batch(app_instance: Dash) -> None:
+    """The five filters must reach the figures only through ``filter-batch``."""
+    callbacks_by_output = {cb["output"]: cb for cb in app_instance._callback_list}
+    batch = callbacks_by_output["filter-batch.data"]
+    assert batch["clientside_function"] is not None
+    assert [item["id"] for item in batch["inputs"]] == [
+        "filter-department",
+        "filter-municipality",
+        "filter-sex",
+        "filter-homicide",
+        "filter-months",
+    ]
+    figures = next(
+        cb for cb in app_instance._callback_list if "mortality-map" in cb["output"]
+    )
+    assert figures["inputs"] == [{"id": "filter-batch", "property": "data"}]
+
+
+def test_figures_are_memoized_per_filter_state(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A repeated filter state must be served from the figure JSON cache."""
+    selection = callbacks._resolve_filters("05", None, "all", [], [1, 12])
+    figures = callbacks._cached_figures(selection)
+    assert figures is not None and len(figures) == 6
+
+    def fail(_: pd.DataFrame) -> None:
+        raise AssertionError("figures were rebuilt")
+
+    monkeypatch.setattr(callbacks, "_build_figures", fail)
+    assert callbacks._cached_figures(selection) == figures
+    empty = callbacks._resolve_filters("99", None, "all", [], [1, 12])
+    assert callbacks._cached_figures(empty) is None
+
+
+def _apply_patch(figure: dict, patch: dict) -> dict:
+    """Replay the Assign/Delete/Merge operations the Dash renderer applies."""
+    result = copy.deepcopy(figure)
+    for operation in patch["operations"]:
+        *parents, key = operation["location"]
+        target = result
+        for parent in parents:
+            target = target.setdefault(parent, {})
+        if operation["operation"] == "Assign":
+            target[key] = operation["params"]["value"]
+        elif operation["operation"] == "Delete":
+            target.pop(key, None)
+        else:
+            target.setdefault(key, {}).update(operation["params"]["value"])
+    return result
+
+
+def test_figure_patches_rebuild_figures_without_template() -> None:
+    """Patches must reproduce each figure from any prior one, minus the template."""
+    selection = callbacks._resolve_filters(None, None, "all", [], [1, 12])
+    figures = callbacks._cached_figures(selection)
+    assert figures is not None
+    placeholders = [
+        figure.to_plotly_json() for figure in callbacks._empty_outputs()[:6]
+    ]
+    for figure, placeholder in zip(figures, placeholders, strict=True):
+        assert set(figure["layout"]) - {"template"} <= callbacks._FIGURE_LAYOUT_KEYS
+        patch = callbacks._figure_patch(figure).to_plotly_json()
+        assert '"template"' not in json.dumps(patch["operations"])
+        for previous in (placeholder, figure):
+            assert _apply_patch(previous, patch) == figure
+        reverse = callbacks._figure_patch(placeholder).to_plotly_json()
+        assert _apply_patch(figure, reverse)["layout"] == placeholder["layout"]
+
+
+def test_lru_cache_evicts_least_recently_used() -> None:
+    """The in-process cache must drop the stalest entry beyond its threshold."""
+    cache = callbacks._LRUCache(default_timeout=0, threshold=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+
+
+def test_send_arrow_csv_writes_header_without_index() -> None:
+    """Exports must be serialized as CSV with a header row and no index."""
+    frame = pd.DataFrame({"muni_cod": ["05001"], "total": [3]}, index=[7])
+    payload = callbacks._send_arrow_csv(frame, "export.csv")
+    assert payload["filename"] == "export.csv"
+    assert payload["base64"] is True
+    content = base64.b64decode(payload["content"]).decode("utf-8")
+    assert content.splitlines() == ['"muni_cod","total"', '"05001",3']
+
+
+def test_count_by_matches_groupby(sample_df: pd.DataFrame) -> None:
+    """Bincount aggregation must agree with the equivalent groupby."""
+    df = sample_df.astype({"depto_cod": "category", "depto": "category"})
+    df.loc[0, "lat"] = float("nan")
+    counted = callbacks._count_by(df, "depto_cod", ["depto"], means=["lat"])
+    expected = (
+        df.groupby(["depto_cod", "depto"], as_index=False, observed=True, sort=False)
+        .agg(total=("causa_cod", "size"), lat=("lat", "mean"))
+        .reset_index(drop=True)
+    )
+    pd.testing.assert_frame_equal(
+        counted.sort_values("depto_cod").reset_index(drop=True),
+        expected.sort_values("depto_cod").reset_index(drop=True),
+    )
+
+
+def test_precomputed_aggregates_render_identical_figures(
+    sample_df: pd.DataFrame,
+) -> None:
+    """Builders fed precomputed counts must match their own aggregation."""
+    counts = callbacks._precompute_aggregates(sample_df)
+    builders = {
+        "lines": lines.build_monthly_line_figure,
+        "bars": bars.build_top_homicide_bars,
+        "pie": pie.build_lowest_mortality_pie,
+        "stacked": stacked.build_stacked_bar_figure,
+        "hist": hist.build_age_histogram,
+    }
+    for name, builder in builders.items():
+        expected = builder(sample_df).to_json()
+        assert builder(sample_df, counts=counts[name]).to_json() == expected
+
+
+@pytest.mark.browser
 @pytest.mark.skipif(
     shutil.which("chromedriver") is None, reason="chromedriver not available in PATH"
 )
-def test_dash_callbacks_render(dash_duo) -> None:
+def test_dash_callbacks_render(dash_duo, app_instance: Dash) -> None:
     """Dash app should render layout and respond to filter interactions."""
-    app = create_app()
-    dash_duo.start_server(app)
+    dash_duo.start_server(app_instance)
 
     dash_duo.wait_for_element("#mortality-map")
     dash_duo.select_dcc_dropdown("#filter-department", "Bogotá")
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import subprocess
+import sys
+from dataclasses import replace
 from pathlib import Path
 
 import pandas as pd
@@ -25,7 +28,7 @@ def test_ingest_command(
     settings = cli.get_settings()
     raw_dir = tmp_path / "raw"
     raw_dir.mkdir()
-    new_settings = settings.model_copy(update={"data_dir": raw_dir})
+    new_settings = replace(settings, data_dir=raw_dir)
     monkeypatch.setattr(cli, "get_settings", lambda: new_settings)
 
     result = runner.invoke(cli.cli, ["ingest"])
@@ -64,7 +67,7 @@ def test_validate_command(
     settings = cli.get_settings()
     raw_dir = tmp_path / "raw"
     raw_dir.mkdir(exist_ok=True)
-    new_settings = settings.model_copy(update={"data_dir": raw_dir})
+    new_settings = replace(settings, data_dir=raw_dir)
     monkeypatch.setattr(cli, "get_settings", lambda: new_settings)
 
     result = runner.invoke(cli.cli, ["validate"])
@@ -79,7 +82,7 @@ def test_validate_without_file(
     settings = cli.get_settings()
     raw_dir = tmp_path / "raw"
     raw_dir.mkdir(exist_ok=True)
-    new_settings = settings.model_copy(update={"data_dir": raw_dir})
+    new_settings = replace(settings, data_dir=raw_dir)
     monkeypatch.setattr(cli, "get_settings", lambda: new_settings)
 
     result = runner.invoke(cli.cli, ["validate"])
@@ -97,13 +100,11 @@ def test_serve_command(
         def run(self, host: str, port: int, debug: bool) -> None:  # type: ignore[override]
             calls["run"] = {"host": host, "port": port, "debug": debug}
 
-    monkeypatch.setattr(cli, "app", DummyApp())
+    monkeypatch.setattr(cli, "_get_app", DummyApp)
     settings = cli.get_settings()
     raw_dir = tmp_path / "raw"
     raw_dir.mkdir(exist_ok=True)
-    new_settings = settings.model_copy(
-        update={"port": 9000, "env": "development", "data_dir": raw_dir}
-    )
+    new_settings = replace(settings, port=9000, env="development", data_dir=raw_dir)
     monkeypatch.setattr(cli, "get_settings", lambda: new_settings)
 
     result = runner.invoke(
@@ -112,3 +113,12 @@ def test_serve_command(
 
     assert result.exit_code == 0
     assert calls["run"] == {"host": "127.0.0.1", "port": 8100, "debug": True}
+
+
+def test_cli_import_does_not_load_dash() -> None:
+    """``ingest`` and ``validate`` must not pay for importing Dash."""
+    code = "import sys, mortalidad.cli; print('dash' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False"
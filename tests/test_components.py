@@ -7,48 +7,32 @@ import plotly.graph_objects as go
 import pytest
 from dash import dash_table
 
+from mortalidad.callbacks import _freeze_dataframe
 from mortalidad.components import bars, hist, lines
 from mortalidad.components import map as map_component
 from mortalidad.components import pie, stacked, table
 from mortalidad.data_loader import GRUPO_EDAD_LABELS
 
+_ORDERED_LABELS = tuple(GRUPO_EDAD_LABELS.values())
 
-@pytest.fixture()
-def sample_df() -> pd.DataFrame:
-    """Return a synthetic dataset emulating the processed mortality frame."""
-    return pd.DataFrame(
-        {
-            "depto_cod": ["11", "11", "05", "05", "76"],
-            "depto": ["Bogotá", "Bogotá", "Antioquia", "Antioquia", "Valle"],
-            "muni_cod": ["11001", "11001", "05001", "05001", "76001"],
-            "municipio": ["Bogotá D.C.", "Bogotá D.C.", "Medellín", "Medellín", "Cali"],
-            "sexo": ["M", "F", "M", "F", "M"],
-            "grupo_edad": [5, 6, 7, 5, 6],
-            "grupo_edad_label": [
-                "15 a 19 años",
-                "20 a 24 años",
-                "25 a 34 años",
-                "15 a 19 años",
-                "20 a 24 años",
-            ],
-            "fecha": pd.to_datetime(
-                ["2019-05-10", "2019-06-11", "2019-07-09", "2019-07-10", "2019-08-01"]
-            ),
-            "anio": [2019, 2019, 2019, 2019, 2019],
-            "mes": [5, 6, 7, 7, 8],
-            "causa_cod": ["X95", "A10", "X95", "B20", "X95"],
-            "causa": [
-                "Agresión con arma de fuego (homicidio)",
-                "Enfermedades infecciosas",
-                "Agresión con arma de fuego (homicidio)",
-                "Enfermedades virales",
-                "Agresión con arma de fuego (homicidio)",
-            ],
-            "homicidio_x95": [1, 0, 1, 0, 1],
-            "lat": [4.711, 4.711, 6.244, 6.244, 3.451],
-            "lon": [-74.072, -74.072, -75.581, -75.581, -76.532],
-        }
-    )
+
+@pytest.mark.parametrize(
+    "builder",
+    [
+        map_component.build_choropleth_figure,
+        lines.build_monthly_line_figure,
+        bars.build_top_homicide_bars,
+        pie.build_lowest_mortality_pie,
+        stacked.build_stacked_bar_figure,
+        hist.build_age_histogram,
+        table.top_causes_records,
+    ],
+)
+def test_builders_do_not_mutate_input(sample_df: pd.DataFrame, builder) -> None:
+    """Builders share the cached base frame, so they must never write to it."""
+    frozen = _freeze_dataframe(sample_df.copy())
+    builder(frozen)
+    pd.testing.assert_frame_equal(frozen, sample_df)
 
 
 def test_build_choropleth_returns_figure(sample_df: pd.DataFrame) -> None:
@@ -78,6 +62,22 @@ def test_map_renders_multiple_markers_for_single_department(
     assert len(scatter_traces[0]["lat"]) == bogota_df["muni_cod"].nunique()
 
 
+def test_map_fills_absent_coordinates_from_reference(
+    monkeypatch: pytest.MonkeyPatch, sample_df: pd.DataFrame
+) -> None:
+    """Rows without coordinate columns must be placed from the reference table."""
+    reference = pd.DataFrame(
+        {"lat": [6.25, 4.65], "lon": [-75.56, -74.08]},
+        index=pd.Index(["05001", "11001"], name="muni_cod"),
+    )
+    monkeypatch.setattr(map_component, "_reference_lookup", lambda: reference)
+    filled = map_component._fill_missing_coordinates(
+        sample_df.drop(columns=["lat", "lon"]).astype({"muni_cod": "category"})
+    )
+    assert filled["lat"].tolist()[:4] == [4.65, 4.65, 6.25, 6.25]
+    assert pd.isna(filled.loc[4, "lat"])
+
+
 def test_build_monthly_line_contains_scatter_trace(sample_df: pd.DataFrame) -> None:
     """Line chart must produce a scatter trace with months."""
     figure = lines.build_monthly_line_figure(sample_df)
@@ -91,7 +91,7 @@ def test_build_homicide_bars_sorted(sample_df: pd.DataFrame) -> None:
     figure = bars.build_top_homicide_bars(sample_df)
     assert isinstance(figure, go.Figure)
     assert figure.data[0].type == "bar"
-    assert figure.data[0].x[0] == "Bogotá D.C."
+    assert figure.data[0].x[0] == "Medellín"
 
 
 def test_build_lowest_mortality_pie(sample_df: pd.DataFrame) -> None:
@@ -116,9 +116,8 @@ def test_build_age_histogram_respects_order(sample_df: pd.DataFrame) -> None:
     figure = hist.build_age_histogram(sample_df)
     assert isinstance(figure, go.Figure)
     categories = list(figure.data[0].x)
-    expected_order = [
-        label for label in GRUPO_EDAD_LABELS.values() if label in categories
-    ]
+    present = set(categories)
+    expected_order = [label for label in _ORDERED_LABELS if label in present]
     assert categories == expected_order
 
 
@@ -127,3 +126,16 @@ def test_build_top_causes_table_returns_datatable(sample_df: pd.DataFrame) -> No
     datatable = table.build_top_causes_table(sample_df)
     assert isinstance(datatable, dash_table.DataTable)
     assert len(datatable.columns) == 3
+
+
+def test_top_causes_records_break_ties_by_code() -> None:
+    """Tied totals must keep the causes in code order."""
+    df = pd.DataFrame(
+        {
+            "causa_cod": ["X95", "X95", "J18", "C34", "A09", "I21", "I21"],
+            "causa": ["Homicidio", "Homicidio", "Neumonía", "Pulmón", "Diarrea"]
+            + ["Infarto", "Infarto"],
+        }
+    )
+    records = table.top_causes_records(df, limit=4)
+    assert [record["causa_cod"] for record in records] == ["I21", "X95", "A09", "C34"]
@@ -0,0 +1,32 @@
+"""Tests for settings parsing."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from mortalidad.config import Settings
+
+
+def test_settings_from_mapping_coerces_values(tmp_path: Path) -> None:
+    """Names are case-insensitive and empty values keep the defaults."""
+    settings = Settings.from_mapping(
+        {
+            "ENV": " Prod ",
+            "Port": "9000",
+            "CACHE_DIR": "",
+            "DATA_DIR": str(tmp_path / "raw"),
+        }
+    )
+    assert settings.env == "prod"
+    assert settings.port == 9000
+    assert settings.cache_dir is None
+    assert settings.data_dir.is_dir()
+    assert settings.is_production
+
+
+def test_settings_reject_unknown_environment() -> None:
+    """Only development and production environments are accepted."""
+    with pytest.raises(ValueError, match="ENV debe ser"):
+        Settings.from_mapping({"ENV": "staging"})
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import os
+import shutil
 from pathlib import Path
 from types import SimpleNamespace
 
@@ -30,15 +32,8 @@ EXPECTED_COLUMNS = [
 ]
 
 
-@pytest.fixture()
-def synthetic_env(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
-    """Create synthetic Excel inputs and patch settings."""
-    data_dir = tmp_path / "data"
-    raw_dir = data_dir / "raw"
-    processed_dir = data_dir / "processed"
-    raw_dir.mkdir(parents=True)
-    processed_dir.mkdir(parents=True)
-
+def _synthetic_sources() -> dict[str, pd.DataFrame]:
+    """Return the raw frames keyed like :data:`data_loader.RAW_FILENAMES`."""
     records_df = pd.DataFrame(
         {
             "DPTO_OCURRE": [11, 11],
@@ -68,20 +63,73 @@ def synthetic_env(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
             "LON": [-74.0721],
         }
     )
+    return {"records": records_df, "causes": causes_df, "divipola": divipola_df}
+
+
+@pytest.fixture(scope="session")
+def synthetic_sources(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Write the synthetic inputs once as fresh Parquet sidecars.
+
+    The workbooks are empty placeholders: the loader only parses a workbook
+    when its sidecar in ``processed`` is missing or stale.
+    """
+    data_dir = tmp_path_factory.mktemp("data")
+    raw_dir = data_dir / "raw"
+    processed_dir = data_dir / "processed"
+    raw_dir.mkdir()
+    processed_dir.mkdir()
 
-    records_df.to_excel(raw_dir / "NoFetal2019.xlsx", index=False, engine="openpyxl")
-    causes_df.to_excel(raw_dir / "CodigosDeMuerte.xlsx", index=False, engine="openpyxl")
-    divipola_df.to_excel(raw_dir / "Divipola.xlsx", index=False, engine="openpyxl")
+    for key, frame in _synthetic_sources().items():
+        workbook = raw_dir / data_loader.RAW_FILENAMES[key]
+        workbook.touch()
+        frame.to_parquet(processed_dir / f"{workbook.stem}.parquet", index=False)
 
+    return raw_dir
+
+
+def _use_raw_dir(monkeypatch: pytest.MonkeyPatch, raw_dir: Path) -> None:
     settings_stub = SimpleNamespace(data_dir=raw_dir, env="test", port=8050)
     monkeypatch.setattr(data_loader, "get_settings", lambda: settings_stub)
 
-    return raw_dir
+
+@pytest.fixture()
+def synthetic_env(synthetic_sources: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point settings at the shared inputs, starting without a processed cache."""
+    cache_path = synthetic_sources.parent / "processed" / data_loader.CACHE_FILENAME
+    cache_path.unlink(missing_ok=True)
+    data_loader._stamp_path(cache_path).unlink(missing_ok=True)
+    _use_raw_dir(monkeypatch, synthetic_sources)
+    return synthetic_sources
+
+
+def test_load_data_parses_source_workbooks(
+    synthetic_sources: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A forced load must parse the workbooks even behind fresh sidecars."""
+    shutil.copytree(
+        synthetic_sources.parent,
+        tmp_path / "data",
+        ignore=shutil.ignore_patterns(f"{data_loader.CACHE_FILENAME}*"),
+    )
+    raw_dir = tmp_path / "data" / "raw"
+    _use_raw_dir(monkeypatch, raw_dir)
+    from_sidecars = data_loader.load_data()
+    processed_dir = raw_dir.parent / "processed"
+    stale = pd.DataFrame({"stale": [1]})
+    for key, frame in _synthetic_sources().items():
+        workbook = raw_dir / data_loader.RAW_FILENAMES[key]
+        frame.to_excel(workbook, index=False, engine="openpyxl")
+        stale.to_parquet(processed_dir / f"{workbook.stem}.parquet", index=False)
+
+    from_workbooks = data_loader.load_data(force_refresh=True)
+    pd.testing.assert_frame_equal(from_workbooks, from_sidecars)
+    rewritten = pd.read_parquet(processed_dir / "NoFetal2019.parquet")
+    assert "stale" not in rewritten.columns
 
 
 def test_load_data_processes_and_caches(synthetic_env: Path) -> None:
     """Ensure the pipeline processes inputs and stores cache."""
-    df = data_loader.load_data(force_refresh=True)
+    df = data_loader.load_data()
     assert list(df.columns) == EXPECTED_COLUMNS
     assert len(df) == 2
 
@@ -115,7 +163,7 @@ def test_load_data_processes_and_caches(synthetic_env: Path) -> None:
 def test_load_data_reuses_cache(synthetic_env: Path) -> None:
     """Ensure cache is reused when source files remain unchanged."""
     cache_path = synthetic_env.parent / "processed" / "mortalidad_2019.parquet"
-    data_loader.load_data(force_refresh=True)
+    data_loader.load_data()
     mtime_before = cache_path.stat().st_mtime
 
     df_cached = data_loader.load_data()
@@ -124,3 +172,211 @@ def test_load_data_reuses_cache(synthetic_env: Path) -> None:
     assert mtime_after == mtime_before
     assert len(df_cached) == 2
     assert set(df_cached["causa_cod"]) == {"X95", "X958"}
+
+
+def test_load_data_skips_validation_of_stamped_cache(
+    synthetic_env: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A cache written after validation must be trusted on warm loads."""
+    fresh = data_loader.load_data()
+
+    def fail(_: pd.DataFrame, **__: object) -> None:
+        raise AssertionError("cached data was validated again")
+
+    monkeypatch.setattr(data_loader.MORTALITY_SCHEMA, "validate", fail)
+    pd.testing.assert_frame_equal(data_loader.load_data(), fresh)
+
+
+@pytest.mark.parametrize("change", ["rewrite_cache", "delete_stamp"])
+def test_load_data_revalidates_changed_cache(
+    synthetic_env: Path, monkeypatch: pytest.MonkeyPatch, change: str
+) -> None:
+    """A cache that no longer matches its stamp must be validated again."""
+    data_loader.load_data()
+    cache_path = synthetic_env.parent / "processed" / data_loader.CACHE_FILENAME
+    if change == "rewrite_cache":
+        pd.read_parquet(cache_path).iloc[::-1].to_parquet(cache_path, index=False)
+        stat = cache_path.stat()
+        os.utime(cache_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    else:
+        data_loader._stamp_path(cache_path).unlink()
+
+    calls: list[int] = []
+    validate = data_loader.MORTALITY_SCHEMA.validate
+
+    def spy(frame: pd.DataFrame, **options: object) -> pd.DataFrame:
+        calls.append(len(frame))
+        return validate(frame, **options)
+
+    monkeypatch.setattr(data_loader.MORTALITY_SCHEMA, "validate", spy)
+    assert len(data_loader.load_data()) == 2
+    assert calls == [2]
+
+
+def test_load_data_uses_categorical_dimensions(synthetic_env: Path) -> None:
+    """Low-cardinality text columns must be exposed as categoricals."""
+    df = data_loader.load_data()
+    for column in data_loader.CATEGORICAL_COLUMNS:
+        assert isinstance(df[column].dtype, pd.CategoricalDtype)
+    assert df["depto_cod"].cat.categories.tolist() == ["11"]
+
+
+def test_load_data_narrows_small_integer_columns(synthetic_env: Path) -> None:
+    """Bounded integer columns must use their narrow dtypes after loading."""
+    df = data_loader.load_data()
+    for column, dtype in data_loader.NARROW_INTEGER_COLUMNS.items():
+        assert df[column].dtype == dtype
+
+
+def test_read_with_parquet_sidecar_reuses_fresh_sidecar(tmp_path: Path) -> None:
+    """The reader must only run while the sidecar is missing or stale."""
+    source = tmp_path / "source.csv"
+    source.write_text("a\n1\n", encoding="utf-8")
+    sidecar = tmp_path / "processed" / "source.parquet"
+    calls: list[Path] = []
+
+    def reader(path: Path) -> pd.DataFrame:
+        calls.append(path)
+        return pd.DataFrame({"a": [1]})
+
+    first = data_loader.read_with_parquet_sidecar(source, sidecar, reader)
+    second = data_loader.read_with_parquet_sidecar(source, sidecar, reader)
+    assert sidecar.exists()
+    assert calls == [source]
+    pd.testing.assert_frame_equal(first, second)
+
+
+def test_read_with_parquet_sidecar_refresh_rewrites_sidecar(tmp_path: Path) -> None:
+    """``refresh`` must re-run the reader even while the sidecar is fresh."""
+    source = tmp_path / "source.csv"
+    source.write_text("a\n1\n", encoding="utf-8")
+    sidecar = tmp_path / "processed" / "source.parquet"
+    values = iter([1, 2])
+
+    def reader(_: Path) -> pd.DataFrame:
+        return pd.DataFrame({"a": [next(values)]})
+
+    data_loader.read_with_parquet_sidecar(source, sidecar, reader)
+    refreshed = data_loader.read_with_parquet_sidecar(
+        source, sidecar, reader, refresh=True
+    )
+    assert refreshed["a"].tolist() == [2]
+    assert pd.read_parquet(sidecar)["a"].tolist() == [2]
+
+
+def test_read_with_parquet_sidecar_recovers_from_corrupt_sidecar(
+    tmp_path: Path,
+) -> None:
+    """A fresh but unreadable sidecar must fall back to ``reader`` and be fixed."""
+    source = tmp_path / "source.csv"
+    source.write_text("a\n1\n", encoding="utf-8")
+    sidecar = tmp_path / "processed" / "source.parquet"
+    sidecar.parent.mkdir()
+    sidecar.write_bytes(b"PAR1 truncated")
+
+    frame = data_loader.read_with_parquet_sidecar(
+        source, sidecar, lambda _: pd.DataFrame({"a": [1]})
+    )
+    assert frame["a"].tolist() == [1]
+    pd.testing.assert_frame_equal(pd.read_parquet(sidecar), frame)
+    assert [path.name for path in sidecar.parent.iterdir()] == ["source.parquet"]
+
+
+def test_prepare_divipola_fills_gaps_from_hoja3_and_dane_csv(tmp_path: Path) -> None:
+    """Missing names and coordinates must come from Hoja3 and the DANE CSV."""
+    source = tmp_path / "Divipola.xlsx"
+    hoja3 = pd.DataFrame(
+        {
+            "Departamento": ["Código", "5"],
+            "Unnamed: 1": ["Nombre", "Antioquia"],
+            "Municipio": ["Código", "5001"],
+            "Unnamed: 3": ["Nombre", "Medellín"],
+            "Tipo": ["", "Municipio"],
+            "Localización": ["Longitud", "-75,58"],
+            "Unnamed: 6": ["Latitud", "6,24"],
+        }
+    )
+    hoja3.to_excel(source, sheet_name="Hoja3", index=False, engine="openpyxl")
+    pd.DataFrame(
+        {
+            "COD_DPTO": ["11"],
+            "NOM_DPTO": ["BOGOTÁ, D.C."],
+            "COD_MPIO": ["11001"],
+            "NOM_MPIO": ["BOGOTÁ, D.C."],
+            "LATITUD": ["4.711"],
+            "LONGITUD": ["-74.072"],
+        }
+    ).to_csv(tmp_path / "dane_municipios.csv", index=False)
+    raw = pd.DataFrame(
+        {
+            "COD_DEPTO": ["05", "11"],
+            "NOM_DEPTO": ["Antioquia", None],
+            "COD_MPIO": ["05001", "11001"],
+            "NOM_MPIO": ["Medellín", "Bogotá D.C."],
+        }
+    )
+
+    catalog = data_loader._prepare_divipola(raw, source).set_index("muni_cod")
+    assert catalog.loc["05001", ["lat", "lon"]].tolist() == [6.24, -75.58]
+    assert catalog.loc["11001", ["lat", "lon"]].tolist() == [4.711, -74.072]
+    assert catalog.loc["11001", "depto"] == "Bogotá, D.C."
+    assert catalog.loc["11001", "municipio"] == "Bogotá D.C."
+
+
+def test_prepare_causes_reads_cie10_layout() -> None:
+    """CIE-10 sheets list three-character entries first and fill descriptions."""
+    raw = pd.DataFrame(
+        {
+            "Código de la CIE-10 tres caracteres": ["A00", "A01", None],
+            "Descripción  de códigos mortalidad a tres caracteres": [
+                "Cólera",
+                None,
+                None,
+            ],
+            "Código de la CIE-10 cuatro caracteres": ["a000", "A01", None],
+            "Descripcion  de códigos mortalidad a cuatro caracteres": [
+                None,
+                "Fiebre paratifoidea",
+                None,
+            ],
+        }
+    )
+    causes = data_loader._prepare_causes(raw)
+    assert causes.values.tolist() == [
+        ["A00", "Cólera"],
+        ["A000", "Cólera"],
+        ["A01", "Sin descripción"],
+    ]
+
+
+@pytest.mark.parametrize("startrow", [0, 8])
+def test_parse_records_workbook_finds_the_header_row(
+    tmp_path: Path, startrow: int
+) -> None:
+    """The streaming reader must accept a header on row 1 or on row 9."""
+    pytest.importorskip("python_calamine")
+    workbook = tmp_path / "NoFetal2019.xlsx"
+    pd.DataFrame(
+        {"COD_DEPARTAMENTO": [11, 5], "AÑO": [2019, 2019], "OTRA": ["x", "y"]}
+    ).to_excel(workbook, index=False, startrow=startrow, engine="openpyxl")
+
+    parsed = data_loader._parse_records_workbook(workbook)
+    expected = data_loader._parse_workbook(workbook)[["COD_DEPARTAMENTO", "AÑO"]]
+    pd.testing.assert_frame_equal(parsed, expected)
+
+
+def test_normalize_code_only_strips_trailing_float_suffix() -> None:
+    """Codes read as floats lose ``.0`` only at the end before zero-padding."""
+    codes = pd.Series([" 5.0 ", 5001, None, "10.05"], dtype=object)
+    normalized = data_loader._normalize_code(codes, width=5)
+    assert normalized.tolist() == ["00005", "05001", "00000", "10.05"]
+
+
+def test_month_starts_match_to_datetime_and_coerce_invalid_parts() -> None:
+    """Year/month pairs map to month starts; invalid pairs become ``NaT``."""
+    years = pd.Series([2019, 2019, 2019, None, 2019.5])
+    months = pd.Series([1, 12, 13, 5, 1])
+    expected = pd.to_datetime(
+        {"year": years, "month": months, "day": 1}, errors="coerce"
+    )
+    pd.testing.assert_series_equal(data_loader._month_starts(years, months), expected)
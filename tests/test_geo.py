@@ -0,0 +1,40 @@
+"""Tests for the Divipola geospatial helpers."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from mortalidad.utils import geo
+
+
+def test_load_divipola_parses_the_workbook_once(tmp_path: Path) -> None:
+    """Repeated loads must reuse the frame memoized for the same reader."""
+    catalog = tmp_path / "Divipola.xlsx"
+    catalog.write_bytes(b"")
+    calls: list[Path] = []
+
+    def reader(path: Path) -> pd.DataFrame:
+        calls.append(path)
+        return pd.DataFrame({"depto_cod": ["05"], "depto": ["Antioquia"]})
+
+    first = geo.load_divipola(reader, catalog)
+    first.loc[0, "depto"] = "Modificado"
+    second = geo.load_divipola(reader, catalog)
+    assert calls == [catalog]
+    assert second.loc[0, "depto"] == "Antioquia"
+    assert list(tmp_path.iterdir()) == [catalog]
+
+    other = geo.load_divipola(lambda _: pd.DataFrame({"hoja": [3]}), catalog)
+    assert other.columns.tolist() == ["hoja"]
+
+
+def test_normalize_department_codes_matches_the_scalar_rule() -> None:
+    """Codes must be stripped and zero-padded, rejecting non-digit values."""
+    codes = pd.Series([" 5 ", "11", "076"])
+    normalized = geo.normalize_department_codes(codes)
+    assert normalized.tolist() == [geo.normalize_department_code(c) for c in codes]
+    with pytest.raises(ValueError, match=r"\['5a', None\]"):
+        geo.normalize_department_codes(pd.Series(["05", "5a", None]))
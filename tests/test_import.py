@@ -1,5 +1,7 @@
 """Smoke tests to validate package importability."""
 
+import pandas as pd
+
 from mortalidad import get_version
 
 
@@ -8,3 +10,8 @@ def test_get_version_returns_string() -> None:
     version = get_version()
     assert isinstance(version, str)
     assert version != ""
+
+
+def test_package_import_enables_copy_on_write() -> None:
+    """The app, the CLI and the tests must share pandas' copy-on-write mode."""
+    assert pd.get_option("mode.copy_on_write") is True
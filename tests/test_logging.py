@@ -0,0 +1,120 @@
+"""Tests for the structured logging helpers."""
+
+from __future__ import annotations
+
+import io
+import json
+import logging
+import sys
+
+import pytest
+from dash import Dash
+
+from mortalidad import logging as logging_module
+from mortalidad.logging import (
+    BytesStreamHandler,
+    JsonFormatter,
+    configure_logging,
+    register_exception_handlers,
+)
+
+
+def _record(message: str, exc_info: object = None) -> logging.LogRecord:
+    return logging.LogRecord(
+        "mortalidad.test", logging.INFO, __file__, 1, message, None, exc_info
+    )
+
+
+def test_json_formatter_emits_one_json_object_per_record() -> None:
+    """Records must serialize to JSON keeping non-ASCII text readable."""
+    line = JsonFormatter().format(_record("Cargando caché"))
+    payload = json.loads(line)
+    assert "caché" in line
+    assert payload["level"] == "INFO"
+    assert payload["logger"] == "mortalidad.test"
+    assert payload["message"] == "Cargando caché"
+    assert "exc_info" not in payload
+
+
+def test_json_formatter_includes_the_traceback() -> None:
+    """Exception records must carry the formatted traceback."""
+    try:
+        raise ValueError("fallo")
+    except ValueError:
+        record = _record("Error", sys.exc_info())
+    formatter = JsonFormatter()
+    payload = json.loads(formatter.format(record))
+    assert payload["exc_info"].endswith("ValueError: fallo")
+    assert record.exc_text == payload["exc_info"]
+    record.exc_text = "cached"
+    assert json.loads(formatter.format(record))["exc_info"] == "cached"
+
+
+def test_unhandled_exceptions_render_the_error_page() -> None:
+    """Unhandled server errors must answer with the static Spanish HTML page."""
+    app = Dash(__name__)
+    register_exception_handlers(app)
+
+    @app.server.route("/boom")
+    def boom() -> str:
+        raise RuntimeError("boom")
+
+    response = app.server.test_client().get("/boom")
+    assert response.status_code == 500
+    assert response.mimetype == "text/html"
+    assert "Algo salió mal" in response.get_data(as_text=True)
+
+
+def test_json_formatter_matches_the_stdlib_timestamp() -> None:
+    """Cached timestamps must equal ``logging.Formatter.formatTime`` output."""
+    for datefmt in ("%Y-%m-%dT%H:%M:%S%z", None):
+        formatter = JsonFormatter(datefmt=datefmt)
+        reference = logging.Formatter(datefmt=datefmt)
+        for created in (1_700_000_000.125, 1_700_000_000.5, 1_700_000_001.0):
+            record = _record("Evento")
+            record.created, record.msecs = created, (created % 1) * 1000
+            assert formatter.formatTime(record, datefmt) == reference.formatTime(
+                record, datefmt
+            )
+
+
+def test_bytes_stream_handler_writes_encoded_json_lines() -> None:
+    """JSON records must reach the byte buffer as UTF-8 lines."""
+    raw = io.BytesIO()
+    stream = io.TextIOWrapper(raw, encoding="utf-8")
+    handler = BytesStreamHandler(stream)
+    handler.setFormatter(JsonFormatter())
+    handler.emit(_record("Señal"))
+    handler.emit(_record("Otra"))
+    lines = raw.getvalue().decode("utf-8").splitlines()
+    assert [json.loads(line)["message"] for line in lines] == ["Señal", "Otra"]
+
+
+def test_configure_logging_installs_handlers_once(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Repeated calls for one environment must not rebuild the handlers."""
+    calls: list[dict[str, object]] = []
+    monkeypatch.setattr(logging_module.logging_config, "dictConfig", calls.append)
+    logging_module._apply_config.cache_clear()
+    try:
+        configure_logging()
+        configure_logging()
+    finally:
+        logging_module._apply_config.cache_clear()
+    assert len(calls) == 1
+
+
+def test_configure_logging_keeps_process_attributes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Other formatters in the process (e.g. gunicorn's) still need ``process``."""
+    monkeypatch.setattr(logging_module.logging_config, "dictConfig", lambda _: None)
+    logging_module._apply_config.cache_clear()
+    try:
+        configure_logging()
+    finally:
+        logging_module._apply_config.cache_clear()
+    record = _record("Evento")
+    assert record.process is not None
+    assert record.thread is not None